@@ -26,14 +26,38 @@ Then visit:
 """
 
 import dash_mantine_components as dmc
-from dash import Dash, dcc, html, page_container
-from dash_improve_my_llms import add_llms_routes, RobotsConfig, mark_hidden
+from dash import Dash, dcc, html, page_container, page_registry
+import dash_improve_my_llms
+from dash_improve_my_llms import _hidden_pages, add_llms_routes, RobotsConfig, mark_hidden
+from flask import Response, request
+from flask_caching import Cache
+import atexit
+import hashlib
 import json
-from pathlib import Path
+import mmap
+import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from orjson import loads as _loads
+
+    # orjson parses straight from a buffer, so large files can be mapped instead of read
+    _LOADS_BUFFERS = True
+except ImportError:  # pragma: no cover - orjson is optional
+    _loads = json.loads
+    _LOADS_BUFFERS = False
 
 # Import bot detection for visitor tracking
-from dash_improve_my_llms.bot_detection import get_bot_type, is_any_bot
+from dash_improve_my_llms.bot_detection import get_bot_type
 
 # Create app with Dash Pages enabled
 app = Dash(__name__, use_pages=True, suppress_callback_exceptions=True)
@@ -69,293 +93,611 @@ add_llms_routes(app)
 mark_hidden("/admin")
 
 # ============================================================================
-# VISITOR TRACKING (for admin dashboard)
+# RESPONSE CACHING
 # ============================================================================
 
-# Path to store visitor analytics
-ANALYTICS_FILE = Path(__file__).parent / "visitor_analytics.json"
-
-
-def load_analytics():
-    """Load analytics data from JSON file."""
-    if ANALYTICS_FILE.exists():
-        with open(ANALYTICS_FILE, "r") as f:
-            data = json.load(f)
-
-            # Clean up any _reload-hash or internal Dash paths from existing data
-            clean_visits = []
-            for visit in data.get("visits", []):
-                path = visit.get("path", "")
-                # Filter out internal Dash paths
-                if not any(ext in path for ext in ['.css', '.js', '.png', '.jpg', '.ico', '_dash', '_reload-hash']):
-                    clean_visits.append(visit)
-
-            # Recalculate stats from clean visits
-            stats = {
-                "desktop": 0,
-                "mobile": 0,
-                "tablet": 0,
-                "bot": 0,
-                "total": 0
-            }
-
-            for visit in clean_visits:
-                device_type = visit.get("device_type", "desktop")
-                stats[device_type] = stats.get(device_type, 0) + 1
-                stats["total"] += 1
-
-            return {
-                "visits": clean_visits,
-                "stats": stats
-            }
-
-    return {
-        "visits": [],
-        "stats": {
-            "desktop": 0,
-            "mobile": 0,
-            "tablet": 0,
-            "bot": 0,
-            "total": 0
-        }
-    }
+# The generated documentation routes only change when the app structure changes,
+# so cache them instead of rebuilding them on every crawler hit
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 3600})
 
 
-def save_analytics(data):
-    """Save analytics data to JSON file."""
-    with open(ANALYTICS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+def _is_cacheable(rv):
+    """Only cache successful responses (errors are returned as tuples or non-200s)."""
+    return not isinstance(rv, tuple) and rv.status_code == 200
 
 
-def detect_device_type(user_agent):
-    """Detect device type from user agent."""
-    ua_lower = user_agent.lower()
+# (endpoint, timeout in seconds, cache per query string)
+_CACHED_ENDPOINTS = [
+    ("serve_architecture_txt", 3600, False),
+    ("serve_llms_txt", 3600, True),
+    ("serve_page_json", 3600, True),
+]
+
+for endpoint, timeout, query_string in _CACHED_ENDPOINTS:
+    view = app.server.view_functions[endpoint]
+    app.server.view_functions[endpoint] = cache.cached(
+        timeout=timeout, query_string=query_string, response_filter=_is_cacheable
+    )(view)
+
+# robots.txt and sitemap.xml are the most crawled routes, so both are rendered once
+# at startup (after mark_hidden) and answered from bytes before any other request
+# hook (bot middleware, tracking) runs. The sitemap is re-rendered when its inputs
+# change: pages registered or moved later (e.g. by the dev server's hot reload), page
+# metadata registered or pages hidden later, a new base URL, or a new day for
+# lastmod. Each body carries an ETag so crawlers and browsers that already have it
+# get a 304.
+STATIC_ROUTE_MAX_AGE = 300
+
+
+def _etag(body):
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+_ROBOTS_TXT_BYTES = app.server.view_functions["serve_robots_txt"]().get_data()
+_ROBOTS_TXT_ETAG = _etag(_ROBOTS_TXT_BYTES)
+_sitemap = {"key": None, "body": None, "etag": None}
+
+
+def _sitemap_bytes():
+    """Return the rendered sitemap, regenerating it when any of its inputs change."""
+    key = (
+        tuple((p["path"], p["name"]) for p in page_registry.values()),
+        dash_improve_my_llms._page_metadata_version,
+        frozenset(_hidden_pages),
+        app._base_url,
+        datetime.now().strftime("%Y-%m-%d"),
+    )
+    if key != _sitemap["key"]:
+        response = app.server.view_functions["serve_sitemap"]()
+        if response.status_code != 200:
+            return None
+        _sitemap["body"] = response.get_data()
+        _sitemap["etag"] = _etag(_sitemap["body"])
+        _sitemap["key"] = key
+    return _sitemap["body"]
+
+
+_sitemap_bytes()
+
+
+def _static_response(body, etag, mimetype):
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_ROUTE_MAX_AGE
+    return response.make_conditional(request)
+
+
+def serve_static_routes():
+    """Short-circuit /robots.txt and /sitemap.xml with pre-rendered responses."""
+    path = request.environ.get("PATH_INFO", "")
+    if path == "/robots.txt":
+        return _static_response(_ROBOTS_TXT_BYTES, _ROBOTS_TXT_ETAG, "text/plain")
+    if path == "/sitemap.xml":
+        body = _sitemap_bytes()
+        if body is not None:
+            return _static_response(body, _sitemap["etag"], "application/xml")
+    return None
+
+
+# Run ahead of the before_request hooks registered by add_llms_routes
+app.server.before_request_funcs.setdefault(None, []).insert(0, serve_static_routes)
+
+# ============================================================================
+# VISITOR TRACKING (for admin dashboard)
+# ============================================================================
+
+# Path to store visitor analytics (SQLite), and the legacy JSON file it replaces.
+# Both live next to app.py unless ANALYTICS_DIR points somewhere else.
+ANALYTICS_DIR = Path(os.environ.get("ANALYTICS_DIR") or Path(__file__).parent)
+ANALYTICS_DB = ANALYTICS_DIR / "visitor_analytics.db"
+ANALYTICS_FILE = ANALYTICS_DIR / "visitor_analytics.json"
+
+# Individual visits kept in the log (totals and hourly counts are kept for all visits)
+MAX_VISITS = 100_000
 
-    if is_any_bot(user_agent):
-        return "bot"
-    elif any(mobile in ua_lower for mobile in ["mobile", "android", "iphone", "ipod"]):
-        return "mobile"
-    elif any(tablet in ua_lower for tablet in ["tablet", "ipad"]):
-        return "tablet"
+# Legacy files larger than this are memory-mapped for parsing (when orjson is installed)
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Seconds the writer waits to coalesce visits, and the most rows it writes at once
+FLUSH_INTERVAL = 5.0
+BATCH_SIZE = 256
+
+# Documentation routes (mostly polled by crawlers) are not tracked, including
+# the per-page /<page>/llms.txt and /<page>/page.json variants
+_UNTRACKED = frozenset(
+    {"/llms.txt", "/page.json", "/architecture.txt", "/robots.txt", "/sitemap.xml"}
+)
+_UNTRACKED_SUFFIXES = ("/llms.txt", "/page.json")
+
+# Asset requests and Dash internal paths are not tracked
+_SKIP_RE = re.compile(r"\.css|\.js|\.png|\.jpg|\.ico|_dash|_reload-hash")
+
+
+def _connect():
+    """Open the visit log (each gunicorn worker opens its own connection)."""
+    conn = sqlite3.connect(str(ANALYTICS_DB), check_same_thread=False, isolation_level=None)
+    # WAL mode lets the admin dashboard read while visits are being appended
+    conn.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL still survives application crashes, without an fsync per commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS visits(ts REAL, path TEXT, device TEXT, bot_type TEXT, ua TEXT)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_device ON visits(device)")
+
+    # Per-hour visit counts, kept up to date by save_analytics() so the admin
+    # dashboard can sum a few buckets instead of scanning the log. Existing logs
+    # are backfilled once; IMMEDIATE keeps concurrent workers from both doing it.
+    conn.execute("BEGIN IMMEDIATE")
+    tables = {
+        name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    if "visits_hourly" not in tables:
+        conn.execute(
+            "CREATE TABLE visits_hourly(hour INTEGER, device TEXT, n INTEGER, "
+            "PRIMARY KEY(hour, device))"
+        )
+        conn.execute(
+            "INSERT INTO visits_hourly "
+            "SELECT CAST(ts / 3600 AS INTEGER), device, COUNT(*) FROM visits GROUP BY 1, 2"
+        )
+    # All-time totals per device, so the dashboard's stat cards are a four-row read
+    if "visits_totals" not in tables:
+        conn.execute("CREATE TABLE visits_totals(device TEXT PRIMARY KEY, n INTEGER)")
+        conn.execute(
+            "INSERT INTO visits_totals SELECT device, SUM(n) FROM visits_hourly GROUP BY device"
+        )
+    conn.execute("COMMIT")
+    return conn
+
+
+_conn = _connect()
+
+# The connection is shared by the writer thread and the startup migration
+_write_lock = threading.Lock()
+
+
+def _count_visits(visits):
+    """Count (ts, path, device, bot_type, ua) rows per (epoch hour, device) and per device."""
+    hourly = {}
+    totals = {}
+    for visit in visits:
+        key = (int(visit[0] // 3600), visit[2])
+        hourly[key] = hourly.get(key, 0) + 1
+        totals[visit[2]] = totals.get(visit[2], 0) + 1
+    return hourly, totals
+
+
+def save_analytics(visits):
+    """Append (ts, path, device, bot_type, ua) rows to the visit log."""
+    # One transaction per batch: the rows land together or not at all, and
+    # the journal is synced once instead of once per autocommitted row
+    with _write_lock:
+        hourly, totals = _count_visits(visits)
+        _conn.execute("BEGIN")
+        try:
+            _conn.executemany("INSERT INTO visits VALUES(?,?,?,?,?)", visits)
+            _conn.executemany(
+                "INSERT INTO visits_hourly VALUES(?,?,?) "
+                "ON CONFLICT(hour, device) DO UPDATE SET n = n + excluded.n",
+                [(hour, device, n) for (hour, device), n in hourly.items()],
+            )
+            _conn.executemany(
+                "INSERT INTO visits_totals VALUES(?,?) "
+                "ON CONFLICT(device) DO UPDATE SET n = n + excluded.n",
+                totals.items(),
+            )
+            # Keep the log a fixed-size ring; older history survives in visits_hourly
+            _conn.execute(
+                "DELETE FROM visits WHERE rowid <= (SELECT MAX(rowid) FROM visits) - ?",
+                (MAX_VISITS,),
+            )
+        except Exception:
+            _conn.execute("ROLLBACK")
+            raise
+        _conn.execute("COMMIT")
+
+
+def _migrate_analytics_once():
+    """Import visits from the legacy JSON file into the database, then set the file aside."""
+    if not ANALYTICS_FILE.exists():
+        return
+
+    if _LOADS_BUFFERS and ANALYTICS_FILE.stat().st_size > MMAP_THRESHOLD:
+        # Parse from the page cache instead of copying the whole file onto the heap
+        with open(ANALYTICS_FILE, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    data = _loads(view)
     else:
-        return "desktop"
+        data = _loads(ANALYTICS_FILE.read_bytes())
+
+    rows = []
+    for visit in data.get("visits", []):
+        path = visit.get("path", "")
+        # Filter out internal Dash paths recorded by older versions
+        if _SKIP_RE.search(path):
+            continue
+
+        timestamp = visit.get("timestamp")
+        try:
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp).timestamp()
+            timestamp = float(timestamp)
+        except (TypeError, ValueError):
+            # A missing or malformed timestamp can't be bucketed; skip the row
+            continue
+
+        rows.append(
+            (
+                timestamp,
+                path,
+                visit.get("device_type", "desktop"),
+                visit.get("bot_type"),
+                visit.get("user_agent", "Unknown"),
+            )
+        )
+
+    save_analytics(rows)
+    ANALYTICS_FILE.replace(ANALYTICS_FILE.with_suffix(".json.migrated"))
+
+
+_migrate_analytics_once()
+
+
+# Visits waiting to be written; request-side producers put, one consumer writes
+_queue = queue.SimpleQueue()
+
+# Put on the queue at shutdown; the writer stops once everything before it is saved
+_STOP = object()
+
+
+def _is_marker(item):
+    """True for _STOP and the flush events put on the queue by flush_analytics()."""
+    return item is _STOP or isinstance(item, threading.Event)
+
+
+def _drain(batch):
+    """Move everything currently queued into batch, up to BATCH_SIZE rows."""
+    while len(batch) < BATCH_SIZE:
+        try:
+            item = _queue.get_nowait()
+        except queue.Empty:
+            break
+        if _is_marker(item):
+            # Leave the marker for the writer loop
+            _queue.put(item)
+            break
+        batch.append(item)
+    return batch
+
+
+def flush_analytics(timeout=FLUSH_INTERVAL + 5):
+    """Wait until every visit recorded so far is in the database.
+
+    The request goes through the tracker pool and the writer, so visits still
+    being classified and the batch the writer is coalescing are saved first.
+    Returns False if the writer did not get there within timeout seconds.
+    """
+    done = threading.Event()
+    _tracker_pool.submit(_queue.put, done)
+    return done.wait(timeout)
+
+
+def _flush_loop():
+    """Consumer loop: wait for a visit, coalesce the next FLUSH_INTERVAL seconds, write once."""
+    while True:
+        item = _queue.get()
+        if item is _STOP:
+            return
+        if isinstance(item, threading.Event):
+            # Everything queued before the flush request has been saved
+            item.set()
+            continue
+        batch = [item]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if _is_marker(item):
+                _queue.put(item)
+                break
+            batch.append(item)
+            _drain(batch)
+        try:
+            save_analytics(batch)
+        except Exception as e:
+            print(f"Error saving analytics: {e}")
+
+
+def _start_flusher():
+    thread = threading.Thread(target=_flush_loop, name="analytics-flusher", daemon=True)
+    thread.start()
+    return thread
+
+
+_flusher = _start_flusher()
+
+
+# User-agent substrings used for device detection
+_MOBILE = ("mobile", "android", "iphone", "ipod")
+_TABLET = ("tablet", "ipad")
+
+
+# Real traffic reuses a small set of user agents, so classifications are cached
+@lru_cache(maxsize=4096)
+def classify_visitor(user_agent):
+    """Return (device_type, bot_type) for a user agent with a single bot scan."""
+    bot_type = get_bot_type(user_agent)
+    if bot_type != "unknown":
+        return "bot", bot_type
 
+    ua_lower = user_agent.lower()
+    if any(mobile in ua_lower for mobile in _MOBILE):
+        return "mobile", None
+    elif any(tablet in ua_lower for tablet in _TABLET):
+        return "tablet", None
+    else:
+        return "desktop", None
 
-def track_visit():
-    """Track page visit with device and bot detection."""
-    from flask import request
 
+def record_visit(path, user_agent, timestamp):
+    """Classify a visit and queue it for the next flush (runs on _tracker_pool)."""
     try:
-        user_agent = request.headers.get('User-Agent', 'Unknown')
-        path = request.path
+        device_type, bot_type = classify_visitor(user_agent)
+
+        # Timestamps are epoch seconds, formatted by the admin dashboard
+        _queue.put((timestamp, path, device_type, bot_type, user_agent))
+
+    except Exception as e:
+        print(f"Error tracking visit: {e}")
 
-        # Don't track asset requests and Dash internal paths
-        if any(ext in path for ext in ['.css', '.js', '.png', '.jpg', '.ico', '_dash', '_reload-hash']):
-            return
 
-        device_type = detect_device_type(user_agent)
-        bot_type = get_bot_type(user_agent) if device_type == "bot" else None
+# Single worker so visits are recorded in order, off the request thread
+_tracker_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="visit-tracker")
 
-        # Load current analytics
-        analytics = load_analytics()
 
-        # Add new visit
-        visit = {
-            "timestamp": datetime.now().isoformat(),
-            "path": path,
-            "device_type": device_type,
-            "bot_type": bot_type,
-            "user_agent": user_agent[:200]  # Truncate long user agents
-        }
+@atexit.register
+def _shutdown_analytics():
+    """Record the visits still in flight and let the writer save them before exit."""
+    _tracker_pool.shutdown(wait=True)
+    _queue.put(_STOP)
+    _flusher.join(timeout=FLUSH_INTERVAL + 5)
 
-        analytics["visits"].append(visit)
-        analytics["stats"][device_type] += 1
-        analytics["stats"]["total"] += 1
 
-        # Keep only last 1000 visits to prevent file from growing too large
-        if len(analytics["visits"]) > 1000:
-            analytics["visits"] = analytics["visits"][-1000:]
+def _reset_analytics_after_fork():
+    """Give a forked worker its own connection, queue and threads.
 
-        save_analytics(analytics)
+    With gunicorn's preload_app the module is imported once in the master;
+    threads do not survive fork() and SQLite connections must not cross it.
+    """
+    global _conn, _write_lock, _queue, _flusher, _tracker_pool
+
+    _conn = _connect()
+    _write_lock = threading.Lock()
+    _queue = queue.SimpleQueue()
+    _flusher = _start_flusher()
+    _tracker_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="visit-tracker")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_analytics_after_fork)
+
+
+def track_visit():
+    """Track page visit with device and bot detection."""
+    try:
+        # Read the WSGI environ directly; both values are plain dict lookups
+        environ = request.environ
+        path = environ.get('PATH_INFO', '')
+
+        # Machine-readable documentation routes are not visitor traffic
+        if path in _UNTRACKED or path.endswith(_UNTRACKED_SUFFIXES):
+            return
+
+        # Don't track asset requests and Dash internal paths
+        if _SKIP_RE.search(path):
+            return
+
+        # Only capture cheap request data here; classification happens on the pool.
+        # Long user agents are truncated, and interned since crawlers repeat them.
+        user_agent = sys.intern(environ.get('HTTP_USER_AGENT', 'Unknown')[:200])
+        _tracker_pool.submit(record_visit, path, user_agent, time.time())
 
     except Exception as e:
         print(f"Error tracking visit: {e}")
 
 
-# Add before_request hook to track all visits
-@app.server.before_request
-def before_request():
-    """Track visitor analytics before each request."""
+# Add after_request hook to track all visits without delaying the response
+@app.server.after_request
+def after_request(response):
+    """Track visitor analytics once the response has been produced."""
     track_visit()
+    return response
 
 
 # ============================================================================
 # MAIN APP LAYOUT
 # ============================================================================
 
-app.layout = dmc.MantineProvider(
+# The shell around page_container is static, so each piece is built once here
+
+_PAGE_LINK_STYLE = {"margin": "0 15px", "textDecoration": "none", "fontWeight": "bold"}
+_DOC_LINK_STYLE = {"margin": "0 10px", "textDecoration": "none"}
+_SEPARATOR_STYLE = {"margin": "0 10px", "color": "#ccc"}
+
+# Header
+_HEADER = html.Div(
+    [
+        html.H1(
+            "Equipment Management System",
+            style={"margin": "0", "color": "white"},
+        ),
+        html.P(
+            "Powered by dash-improve-my-llms v0.2.0 with Bot Management & SEO",
+            style={
+                "margin": "5px 0 0 0",
+                "fontSize": "14px",
+                "color": "rgba(255,255,255,0.8)",
+            },
+        ),
+    ],
+    style={
+        "padding": "20px",
+        "background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
+        "color": "white",
+    },
+)
+
+# Navigation
+_NAV = html.Div(
+    [
+        # Page Navigation
+        dcc.Link(
+            "🏠 Home",
+            href="/",
+            style=_PAGE_LINK_STYLE,
+        ),
+        dcc.Link(
+            "🔧 Equipment",
+            href="/equipment",
+            style=_PAGE_LINK_STYLE,
+        ),
+        dcc.Link(
+            "📊 Analytics",
+            href="/analytics",
+            style=_PAGE_LINK_STYLE,
+        ),
+        dcc.Link(
+            "🔒 Admin",
+            href="/admin",
+            style={
+                "margin": "0 15px",
+                "textDecoration": "none",
+                "fontWeight": "bold",
+                "color": "#ff6b6b"
+            },
+        ),
+
+        html.Span("|", style=_SEPARATOR_STYLE),
+
+        # Documentation Links (v0.1.0)
+        html.A(
+            "📄 llms.txt",
+            href="/llms.txt",
+            target="_blank",
+            style=_DOC_LINK_STYLE,
+        ),
+        html.A(
+            "📋 page.json",
+            href="/page.json",
+            target="_blank",
+            style=_DOC_LINK_STYLE,
+        ),
+        html.A(
+            "🏗️ architecture.txt",
+            href="/architecture.txt",
+            target="_blank",
+            style=_DOC_LINK_STYLE,
+        ),
+
+        html.Span("|", style=_SEPARATOR_STYLE),
+
+        # SEO Links (v0.2.0 NEW!)
+        html.A(
+            "🤖 robots.txt",
+            href="/robots.txt",
+            target="_blank",
+            style={"margin": "0 10px", "textDecoration": "none", "color": "#51cf66"},
+            title="NEW v0.2.0: Bot access control"
+        ),
+        html.A(
+            "🗺️ sitemap.xml",
+            href="/sitemap.xml",
+            target="_blank",
+            style={"margin": "0 10px", "textDecoration": "none", "color": "#51cf66"},
+            title="NEW v0.2.0: SEO sitemap"
+        ),
+    ],
+    style={
+        "padding": "15px 20px",
+        "background": "#f8f9fa",
+        "borderBottom": "2px solid #e0e0e0",
+        "fontSize": "14px",
+    },
+)
+
+# Footer with v0.2.0 features
+_FOOTER = html.Div(
     [
         html.Div(
             [
-                # Header
-                html.Div(
-                    [
-                        html.H1(
-                            "Equipment Management System",
-                            style={"margin": "0", "color": "white"},
-                        ),
-                        html.P(
-                            "Powered by dash-improve-my-llms v0.2.0 with Bot Management & SEO",
-                            style={
-                                "margin": "5px 0 0 0",
-                                "fontSize": "14px",
-                                "color": "rgba(255,255,255,0.8)",
-                            },
-                        ),
-                    ],
-                    style={
-                        "padding": "20px",
-                        "background": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
-                        "color": "white",
-                    },
+                html.Strong("✨ NEW in v0.2.0: "),
+                "Bot Management • SEO Optimization • Privacy Controls • Visitor Analytics",
+            ],
+            style={
+                "textAlign": "center",
+                "color": "#51cf66",
+                "fontSize": "14px",
+                "marginBottom": "10px",
+                "fontWeight": "bold"
+            },
+        ),
+        html.P(
+            [
+                "Built with ",
+                html.A(
+                    "Dash",
+                    href="https://dash.plotly.com",
+                    target="_blank",
                 ),
-
-                # Navigation
-                html.Div(
-                    [
-                        # Page Navigation
-                        dcc.Link(
-                            "🏠 Home",
-                            href="/",
-                            style={"margin": "0 15px", "textDecoration": "none", "fontWeight": "bold"},
-                        ),
-                        dcc.Link(
-                            "🔧 Equipment",
-                            href="/equipment",
-                            style={"margin": "0 15px", "textDecoration": "none", "fontWeight": "bold"},
-                        ),
-                        dcc.Link(
-                            "📊 Analytics",
-                            href="/analytics",
-                            style={"margin": "0 15px", "textDecoration": "none", "fontWeight": "bold"},
-                        ),
-                        dcc.Link(
-                            "🔒 Admin",
-                            href="/admin",
-                            style={
-                                "margin": "0 15px",
-                                "textDecoration": "none",
-                                "fontWeight": "bold",
-                                "color": "#ff6b6b"
-                            },
-                        ),
-
-                        html.Span("|", style={"margin": "0 10px", "color": "#ccc"}),
-
-                        # Documentation Links (v0.1.0)
-                        html.A(
-                            "📄 llms.txt",
-                            href="/llms.txt",
-                            target="_blank",
-                            style={"margin": "0 10px", "textDecoration": "none"},
-                        ),
-                        html.A(
-                            "📋 page.json",
-                            href="/page.json",
-                            target="_blank",
-                            style={"margin": "0 10px", "textDecoration": "none"},
-                        ),
-                        html.A(
-                            "🏗️ architecture.txt",
-                            href="/architecture.txt",
-                            target="_blank",
-                            style={"margin": "0 10px", "textDecoration": "none"},
-                        ),
-
-                        html.Span("|", style={"margin": "0 10px", "color": "#ccc"}),
-
-                        # SEO Links (v0.2.0 NEW!)
-                        html.A(
-                            "🤖 robots.txt",
-                            href="/robots.txt",
-                            target="_blank",
-                            style={"margin": "0 10px", "textDecoration": "none", "color": "#51cf66"},
-                            title="NEW v0.2.0: Bot access control"
-                        ),
-                        html.A(
-                            "🗺️ sitemap.xml",
-                            href="/sitemap.xml",
-                            target="_blank",
-                            style={"margin": "0 10px", "textDecoration": "none", "color": "#51cf66"},
-                            title="NEW v0.2.0: SEO sitemap"
-                        ),
-                    ],
-                    style={
-                        "padding": "15px 20px",
-                        "background": "#f8f9fa",
-                        "borderBottom": "2px solid #e0e0e0",
-                        "fontSize": "14px",
-                    },
+                " and ",
+                html.A(
+                    "dash-improve-my-llms",
+                    href="https://github.com/yourusername/dash-improve-my-llms",
+                    target="_blank",
+                ),
+                " | ",
+                html.A(
+                    "View Test Report (88/88 passing)",
+                    href="https://github.com/yourusername/dash-improve-my-llms/blob/main/TEST_REPORT.md",
+                    target="_blank",
+                    style={"color": "#51cf66"}
                 ),
+            ],
+            style={
+                "textAlign": "center",
+                "color": "#666",
+                "fontSize": "14px",
+            },
+        ),
+    ],
+    style={
+        "padding": "20px",
+        "borderTop": "1px solid #e0e0e0",
+        "marginTop": "40px",
+        "background": "#f8f9fa",
+    },
+)
 
+app.layout = dmc.MantineProvider(
+    [
+        html.Div(
+            [
+                _HEADER,
+                _NAV,
                 # Page content
                 html.Div(
                     [page_container],
                     style={"padding": "30px", "maxWidth": "1400px", "margin": "0 auto"},
                 ),
-
-                # Footer with v0.2.0 features
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                html.Strong("✨ NEW in v0.2.0: "),
-                                "Bot Management • SEO Optimization • Privacy Controls • Visitor Analytics",
-                            ],
-                            style={
-                                "textAlign": "center",
-                                "color": "#51cf66",
-                                "fontSize": "14px",
-                                "marginBottom": "10px",
-                                "fontWeight": "bold"
-                            },
-                        ),
-                        html.P(
-                            [
-                                "Built with ",
-                                html.A(
-                                    "Dash",
-                                    href="https://dash.plotly.com",
-                                    target="_blank",
-                                ),
-                                " and ",
-                                html.A(
-                                    "dash-improve-my-llms",
-                                    href="https://github.com/yourusername/dash-improve-my-llms",
-                                    target="_blank",
-                                ),
-                                " | ",
-                                html.A(
-                                    "View Test Report (88/88 passing)",
-                                    href="https://github.com/yourusername/dash-improve-my-llms/blob/main/TEST_REPORT.md",
-                                    target="_blank",
-                                    style={"color": "#51cf66"}
-                                ),
-                            ],
-                            style={
-                                "textAlign": "center",
-                                "color": "#666",
-                                "fontSize": "14px",
-                            },
-                        ),
-                    ],
-                    style={
-                        "padding": "20px",
-                        "borderTop": "1px solid #e0e0e0",
-                        "marginTop": "40px",
-                        "background": "#f8f9fa",
-                    },
-                ),
+                _FOOTER,
             ],
             style={"fontFamily": "Arial, sans-serif"},
         ),
@@ -17,12 +17,20 @@ import re
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from dash import callback_context, dcc, hooks, html
+from dash import callback_context, dcc, hooks, html, page_registry, register_page
 from flask import Response, jsonify
 
+try:
+    import orjson
+except ImportError:  # optional speedup; Flask's JSON provider is used instead
+    orjson = None
+
 # Global registry to track important components
 _important_components = set()
 _page_metadata = {}
+# Bumped on every register_page_metadata() call, so callers caching output
+# derived from _page_metadata can tell when it changed
+_page_metadata_version = 0
 
 # Global registry to track hidden pages/components
 _hidden_pages = set()
@@ -158,6 +166,10 @@ def is_component_hidden(component_id: str) -> bool:
     return component_id in _hidden_components
 
 
+_HEADING_TYPES = frozenset(("H1", "H2", "H3", "H4", "H5", "H6"))
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
 def extract_text_content(
     component, is_important_section: bool = False, depth: int = 0, max_depth: int = 20
 ) -> List[str]:
@@ -173,57 +185,48 @@ def extract_text_content(
     Returns:
         List of text strings found in the component
     """
-    if depth > max_depth:
-        return []
-
     texts = []
+    _collect_text(component, is_important_section, depth, max_depth, texts)
+    return texts
 
-    # Check if this component is marked as important
-    if hasattr(component, "id") and component.id:
-        is_important_section = is_important_section or is_important(component.id)
+
+def _collect_text(component, important: bool, depth: int, max_depth: int, texts: List[str]):
+    """Append the text of ``component`` and its descendants to ``texts`` in place."""
+    if depth > max_depth:
+        return
 
     # Extract direct text content
     if isinstance(component, str):
         text = component.strip()
         if text:
-            prefix = "[IMPORTANT] " if is_important_section else ""
-            texts.append(f"{prefix}{text}")
-        return texts
+            texts.append(f"[IMPORTANT] {text}" if important else text)
+        return
 
-    # Handle different component types
-    component_name = (
-        component.__class__.__name__ if hasattr(component, "__class__") else str(type(component))
-    )
+    # Check if this component is marked as important
+    if not important:
+        component_id = getattr(component, "id", None)
+        if component_id:
+            important = is_important(component_id)
+    prefix = "[IMPORTANT] " if important else ""
 
-    # Extract from children
-    if hasattr(component, "children"):
-        children = component.children
-        if children is not None:
-            if isinstance(children, list):
-                for child in children:
-                    texts.extend(
-                        extract_text_content(child, is_important_section, depth + 1, max_depth)
-                    )
-            else:
-                texts.extend(
-                    extract_text_content(children, is_important_section, depth + 1, max_depth)
-                )
+    # Headings come before their children's text
+    children = getattr(component, "children", None)
+    if isinstance(children, str) and component.__class__.__name__ in _HEADING_TYPES:
+        texts.append(f"{prefix}## {children}")
 
-    # Extract from specific properties based on component type
-    if component_name in ["H1", "H2", "H3", "H4", "H5", "H6"]:
-        prefix = "[IMPORTANT] " if is_important_section else ""
-        if hasattr(component, "children") and isinstance(component.children, str):
-            texts.insert(0, f"{prefix}## {component.children}")
+    # Extract from children
+    if children is not None:
+        if isinstance(children, list):
+            for child in children:
+                _collect_text(child, important, depth + 1, max_depth, texts)
+        else:
+            _collect_text(children, important, depth + 1, max_depth, texts)
 
     # Extract labels, placeholders, titles
-    for prop in ["label", "placeholder", "title", "value"]:
-        if hasattr(component, prop):
-            val = getattr(component, prop)
-            if isinstance(val, str) and val.strip():
-                prefix = "[IMPORTANT] " if is_important_section else ""
-                texts.append(f"{prefix}{val}")
-
-    return texts
+    for prop in ("label", "placeholder", "title", "value"):
+        val = getattr(component, prop, None)
+        if isinstance(val, str) and val.strip():
+            texts.append(f"{prefix}{val}")
 
 
 def extract_component_architecture(
@@ -241,73 +244,69 @@ def extract_component_architecture(
     Returns:
         Dictionary describing component architecture
     """
-    # Fix off-by-one error: use >= instead of >
-    if depth >= max_depth:
-        return {"error": "max_depth_exceeded"}
-
-    if isinstance(component, str):
-        # Fix: Include importance flag for text nodes
-        return {
-            "type": "text",
-            "content": component[:100],
-            "important": parent_important,
-        }
-
-    info = {}
-    component_name = (
-        component.__class__.__name__ if hasattr(component, "__class__") else str(type(component))
-    )
-    info["type"] = component_name
-    info["module"] = component.__module__ if hasattr(component, "__module__") else None
-
-    # Check if marked important
-    is_important_comp = parent_important
-    if hasattr(component, "id") and component.id:
-        info["id"] = component.id
-        is_important_comp = is_important_comp or is_important(component.id)
-
-    info["important"] = is_important_comp
-
-    # Extract key properties
-    props = {}
-    if hasattr(component, "__dict__"):
-        for key, value in component.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if key in ["children"]:
+    # Iterative walk: each stack entry carries the list its node's info should be
+    # appended to. Siblings are pushed in reverse so they pop, and land in their
+    # parent's list, in order.
+    root = []
+    stack = [(component, depth, parent_important, root)]
+    while stack:
+        node, node_depth, parent_imp, siblings = stack.pop()
+
+        # Fix off-by-one error: use >= instead of >
+        if node_depth >= max_depth:
+            siblings.append({"error": "max_depth_exceeded"})
+            continue
+
+        if isinstance(node, str):
+            # Fix: Include importance flag for text nodes
+            siblings.append({"type": "text", "content": node[:100], "important": parent_imp})
+            continue
+
+        info = {}
+        info["type"] = node.__class__.__name__
+        info["module"] = getattr(node, "__module__", None)
+
+        # Check if marked important
+        is_important_comp = parent_imp
+        if hasattr(node, "id") and node.id:
+            info["id"] = node.id
+            is_important_comp = is_important_comp or is_important(node.id)
+
+        info["important"] = is_important_comp
+
+        # Extract key properties
+        props = {}
+        for key, value in getattr(node, "__dict__", {}).items():
+            if key.startswith("_") or key == "children":
                 continue
-            if isinstance(value, (str, int, float, bool, type(None))):
+            if isinstance(value, _SCALAR_TYPES):
                 props[key] = value
             elif isinstance(value, dict):
-                props[key] = {
-                    k: v
-                    for k, v in value.items()
-                    if isinstance(v, (str, int, float, bool, type(None)))
-                }
+                props[key] = {k: v for k, v in value.items() if isinstance(v, _SCALAR_TYPES)}
             elif isinstance(value, list) and len(value) < 10:
-                props[key] = [
-                    v for v in value if isinstance(v, (str, int, float, bool, type(None)))
-                ]
+                props[key] = [v for v in value if isinstance(v, _SCALAR_TYPES)]
 
-    if props:
-        info["props"] = props
+        if props:
+            info["props"] = props
+        siblings.append(info)
 
-    # Process children
-    if hasattr(component, "children") and component.children is not None:
-        children = component.children
-        if isinstance(children, list):
-            info["children"] = [
-                extract_component_architecture(child, depth + 1, max_depth, is_important_comp)
-                for child in children
-            ]
+        # Process children
+        children = getattr(node, "children", None)
+        if children is not None:
+            if not isinstance(children, list):
+                children = [children]
             info["children_count"] = len(children)
-        else:
-            info["children"] = [
-                extract_component_architecture(children, depth + 1, max_depth, is_important_comp)
-            ]
-            info["children_count"] = 1
+            if node_depth + 1 >= max_depth:
+                # Children are past the limit; record them without visiting
+                info["children"] = [{"error": "max_depth_exceeded"} for _ in children]
+                continue
+            info["children"] = child_infos = []
+            stack.extend(
+                (child, node_depth + 1, is_important_comp, child_infos)
+                for child in reversed(children)
+            )
 
-    return info
+    return root[0]
 
 
 def generate_llms_txt(
@@ -829,7 +828,8 @@ def generate_page_json(page_path: str, layout_func, app=None) -> Dict:
         "DatePicker",
     }
     interactive_count = sum(comp_types.get(t, 0) for t in interactive_types)
-    static_count = count_total_components(architecture) - interactive_count
+    total_count = count_total_components(architecture)
+    static_count = total_count - interactive_count
 
     # Build comprehensive page.json
     page_info = {
@@ -842,7 +842,7 @@ def generate_page_json(page_path: str, layout_func, app=None) -> Dict:
             "categories": component_categories,
             "types": comp_types,
             "counts": {
-                "total": count_total_components(architecture),
+                "total": total_count,
                 "interactive": interactive_count,
                 "static": static_count,
                 "unique_types": len(comp_types),
@@ -884,31 +884,29 @@ def generate_page_json(page_path: str, layout_func, app=None) -> Dict:
 def count_component_types(arch: Dict) -> Dict[str, int]:
     """Count occurrences of each component type"""
     counts = defaultdict(int)
-
-    def count_recursive(node):
+    # Pre-order walk; children are pushed reversed so types keep first-seen order
+    stack = [arch]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict) and "type" in node:
             counts[node["type"]] += 1
-            if "children" in node and isinstance(node["children"], list):
-                for child in node["children"]:
-                    count_recursive(child)
-
-    count_recursive(arch)
+            children = node.get("children")
+            if isinstance(children, list):
+                stack.extend(reversed(children))
     return dict(counts)
 
 
 def count_total_components(arch: Dict) -> int:
     """Count total number of components"""
     count = 0
-
-    def count_recursive(node):
-        nonlocal count
+    stack = [arch]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             count += 1
-            if "children" in node and isinstance(node["children"], list):
-                for child in node["children"]:
-                    count_recursive(child)
-
-    count_recursive(arch)
+            children = node.get("children")
+            if isinstance(children, list):
+                stack.extend(children)
     return count
 
 
@@ -949,7 +947,30 @@ def register_page_metadata(path: str, name: str = None, description: str = None,
         description: Page description
         **kwargs: Additional metadata
     """
+    global _page_metadata_version
+
     _page_metadata[path] = {"name": name, "description": description, **kwargs}
+    _page_metadata_version += 1
+
+
+def register_page_with_meta(
+    module: str, path: str, name: str = None, description: str = None, **kwargs
+):
+    """
+    Register a Dash page and its llms.txt metadata in one call.
+
+    Equivalent to calling ``dash.register_page`` followed by
+    ``register_page_metadata`` with the same arguments.
+
+    Args:
+        module: Page module name (usually ``__name__``)
+        path: Page path
+        name: Display name (Dash derives one from the module if omitted)
+        description: Page description
+        **kwargs: Additional arguments passed to ``dash.register_page``
+    """
+    register_page(module, path=path, name=name, description=description, **kwargs)
+    register_page_metadata(path, name=page_registry[module]["name"], description=description)
 
 
 def generate_architecture_txt(app) -> str:
@@ -1210,6 +1231,23 @@ def generate_architecture_txt(app) -> str:
     return "\n".join(output)
 
 
+def _json_response(data) -> Response:
+    """
+    Serialize data as a JSON response, using orjson when it is installed.
+
+    Keys are sorted to match Flask's default output. Anything orjson can't
+    encode falls back to ``jsonify``.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            return Response(body, mimetype="application/json")
+    return jsonify(data)
+
+
 def add_llms_routes(app, config: Optional[LLMSConfig] = None):
     """
     Add LLMS routes to a Dash app.
@@ -1451,7 +1489,7 @@ def add_llms_routes(app, config: Optional[LLMSConfig] = None):
 
                 if layout_func:
                     page_json = generate_page_json(page_path, layout_func)
-                    return jsonify(page_json)
+                    return _json_response(page_json)
         except Exception as e:
             import traceback
 
@@ -1561,6 +1599,7 @@ __all__ = [
     "mark_component_hidden",
     "is_component_hidden",
     "register_page_metadata",
+    "register_page_with_meta",
     "LLMSConfig",
     "RobotsConfig",
     "setup_llms_plugin",
@@ -5,7 +5,9 @@ This module provides functionality to detect and classify different types
 of bots (AI training, AI search, traditional search engines) from user agents.
 """
 
-from typing import List
+import re
+from functools import lru_cache
+from typing import Iterable, List
 
 # Comprehensive list of known AI bot user agents
 AI_TRAINING_BOTS = [
@@ -35,6 +37,21 @@ TRADITIONAL_BOTS = [
 ]
 
 
+def _compile(signatures: List[str]) -> "re.Pattern[str]":
+    """Compile lowercase signatures into one alternation."""
+    return re.compile("|".join(map(re.escape, signatures)))
+
+
+# Matching runs on every request, so each list is compiled once into a single
+# regex and checked in one C-level pass over the lowercased user agent (a
+# re.IGNORECASE pattern is over ten times slower, as it defeats sre's literal
+# prefix scan). Edits to the lists above made after import are not picked up.
+_TRAINING_RE = _compile(AI_TRAINING_BOTS)
+_SEARCH_RE = _compile(AI_SEARCH_BOTS)
+_TRADITIONAL_RE = _compile(TRADITIONAL_BOTS)
+_ANY_RE = _compile(AI_TRAINING_BOTS + AI_SEARCH_BOTS + TRADITIONAL_BOTS)
+
+
 def is_ai_training_bot(user_agent: str) -> bool:
     """
     Check if request is from an AI training crawler.
@@ -45,8 +62,7 @@ def is_ai_training_bot(user_agent: str) -> bool:
     Returns:
         True if the user agent matches known AI training bots
     """
-    ua_lower = user_agent.lower()
-    return any(bot in ua_lower for bot in AI_TRAINING_BOTS)
+    return _TRAINING_RE.search(user_agent.lower()) is not None
 
 
 def is_ai_search_bot(user_agent: str) -> bool:
@@ -59,8 +75,7 @@ def is_ai_search_bot(user_agent: str) -> bool:
     Returns:
         True if the user agent matches known AI search bots
     """
-    ua_lower = user_agent.lower()
-    return any(bot in ua_lower for bot in AI_SEARCH_BOTS)
+    return _SEARCH_RE.search(user_agent.lower()) is not None
 
 
 def is_traditional_bot(user_agent: str) -> bool:
@@ -73,10 +88,15 @@ def is_traditional_bot(user_agent: str) -> bool:
     Returns:
         True if the user agent matches known traditional search bots
     """
-    ua_lower = user_agent.lower()
-    return any(bot in ua_lower for bot in TRADITIONAL_BOTS)
+    return _TRADITIONAL_RE.search(user_agent.lower()) is not None
+
 
+# is_any_bot and get_bot_type run on every request from the bot middleware. Real
+# traffic repeats a small set of user agents, so their results are cached.
+_CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def is_any_bot(user_agent: str) -> bool:
     """
     Check if request is from any bot (AI or traditional).
@@ -87,11 +107,10 @@ def is_any_bot(user_agent: str) -> bool:
     Returns:
         True if the user agent matches any known bot
     """
-    ua_lower = user_agent.lower()
-    all_bots = AI_TRAINING_BOTS + AI_SEARCH_BOTS + TRADITIONAL_BOTS
-    return any(bot in ua_lower for bot in all_bots)
+    return _ANY_RE.search(user_agent.lower()) is not None
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def get_bot_type(user_agent: str) -> str:
     """
     Identify bot type from user agent.
@@ -102,13 +121,38 @@ def get_bot_type(user_agent: str) -> str:
     Returns:
         One of: 'training', 'search', 'traditional', or 'unknown'
     """
-    if is_ai_training_bot(user_agent):
+    ua_lower = user_agent.lower()
+    # Most traffic is not a bot, so settle that with one scan
+    if _ANY_RE.search(ua_lower) is None:
+        return "unknown"
+    if _TRAINING_RE.search(ua_lower):
         return "training"
-    elif is_ai_search_bot(user_agent):
+    elif _SEARCH_RE.search(ua_lower):
         return "search"
-    elif is_traditional_bot(user_agent):
-        return "traditional"
-    return "unknown"
+    return "traditional"
+
+
+def classify_bots(user_agents: Iterable[str]) -> List[str]:
+    """
+    Identify the bot type of many user agents, e.g. from an access log.
+
+    Each distinct user agent is classified once, so logs dominated by a
+    few crawlers cost little more than their number of unique agents.
+
+    Args:
+        user_agents: User agent strings
+
+    Returns:
+        Bot type for each user agent, in input order (see get_bot_type)
+    """
+    types = {}
+    result = []
+    for ua in user_agents:
+        bot_type = types.get(ua)
+        if bot_type is None:
+            bot_type = types[ua] = get_bot_type(ua)
+        result.append(bot_type)
+    return result
 
 
 def get_all_bot_lists() -> dict:
@@ -6,7 +6,50 @@ even when they cannot execute JavaScript.
 """
 
 import json
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Union
+
+# Fields shared by the WebApplication JSON-LD blocks of both templates
+_WEB_APPLICATION_LD = {
+    "@context": "https://schema.org",
+    "@type": "WebApplication",
+    "applicationCategory": "BusinessApplication",
+}
+
+
+# Same replacements as html.escape(quote=True), applied in one C-level pass
+_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _esc(value) -> str:
+    """Escape a page name or description for use in HTML text or attributes."""
+    return str(value).translate(_ESCAPE_TABLE)
+
+
+def _ld_json(data: Dict) -> str:
+    """Serialize JSON-LD for a <script> block, keeping "</" from closing the tag."""
+    return json.dumps(data, indent=2).replace("</", "<\\/")
+
+
+def index_important_sections(marked_important: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Group important content sections by page path.
+
+    Build this once and pass it to generate_static_page_html when rendering
+    many pages, instead of filtering the full list for every page.
+
+    Args:
+        marked_important: Important content sections, each with a "page_path"
+
+    Returns:
+        Dict mapping page path to its sections, in their original order
+    """
+    index = defaultdict(list)
+    for item in marked_important:
+        index[item.get("page_path")].append(item)
+    return dict(index)
 
 
 def generate_static_page_html(
@@ -14,7 +57,7 @@ def generate_static_page_html(
     page_metadata: Dict,
     all_pages: List[Dict],
     app_config: Dict,
-    marked_important: List[Dict],
+    marked_important: Union[List[Dict], Dict[str, List[Dict]]],
 ) -> str:
     """
     Generate static HTML for a specific page that AI agents can read.
@@ -24,7 +67,8 @@ def generate_static_page_html(
         page_metadata: Metadata for current page
         all_pages: List of all registered pages
         app_config: Application configuration
-        marked_important: Important content sections
+        marked_important: Important content sections, either as a list or
+            pre-grouped by index_important_sections()
 
     Returns:
         Complete HTML string
@@ -32,6 +76,8 @@ def generate_static_page_html(
 
     title = page_metadata.get("name", "Dashboard")
     description = page_metadata.get("description", "")
+    title_html = _esc(title)
+    description_html = _esc(description)
 
     # Build navigation from all pages
     nav_items = []
@@ -39,31 +85,32 @@ def generate_static_page_html(
         is_current = page.get("path") == page_path
         class_attr = ' class="current"' if is_current else ""
         nav_items.append(
-            f'<li{class_attr}><a href="{page.get("path", "/")}">{page.get("name", "Page")}</a></li>'
+            f'<li{class_attr}><a href="{page.get("path", "/")}">{_esc(page.get("name", "Page"))}</a></li>'
         )
 
     # Build important content sections
     content_sections = []
-    for item in marked_important:
-        if item.get("page_path") == page_path:
-            section_id = item.get("id", "")
-            id_attr = f' id="{section_id}"' if section_id else ""
-            content_sections.append(
-                f"""
+    if isinstance(marked_important, dict):
+        page_sections = marked_important.get(page_path, ())
+    else:
+        page_sections = [m for m in marked_important if m.get("page_path") == page_path]
+    for item in page_sections:
+        section_id = item.get("id", "")
+        id_attr = f' id="{section_id}"' if section_id else ""
+        content_sections.append(
+            f"""
                 <section{id_attr}>
                     {item.get('html_content', '')}
                 </section>
             """
-            )
+        )
 
     # Generate structured data (JSON-LD)
     structured_data = {
-        "@context": "https://schema.org",
-        "@type": "WebApplication",
+        **_WEB_APPLICATION_LD,
         "name": app_config.get("name", "Dashboard"),
         "url": f"{app_config.get('base_url', '')}{page_path}",
         "description": description,
-        "applicationCategory": "BusinessApplication",
     }
 
     html = f"""<!DOCTYPE html>
@@ -71,18 +118,18 @@ def generate_static_page_html(
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{description}">
+    <meta name="description" content="{description_html}">
     <meta name="robots" content="index, follow">
 
     <!-- AI Discovery Hints -->
     <link rel="alternate" type="text/markdown" href="{page_path}/llms.txt">
     <link rel="alternate" type="application/json" href="{page_path}/page.json">
 
-    <title>{title}</title>
+    <title>{title_html}</title>
 
     <!-- Structured Data for AI Understanding -->
     <script type="application/ld+json">
-    {json.dumps(structured_data, indent=2)}
+    {_ld_json(structured_data)}
     </script>
 
     <style>
@@ -135,8 +182,8 @@ def generate_static_page_html(
 </head>
 <body>
     <header>
-        <h1>{title}</h1>
-        <p>{description}</p>
+        <h1>{title_html}</h1>
+        <p>{description_html}</p>
     </header>
 
     <nav aria-label="Main navigation">
@@ -186,6 +233,17 @@ def generate_index_template(app_config: Dict, pages: List[Dict]) -> str:
     app_name = app_config.get("name", "Dash Application")
     app_description = app_config.get("description", "Interactive dashboard application")
     base_url = app_config.get("base_url", "https://example.com")
+    app_name_html = _esc(app_name)
+    app_description_html = _esc(app_description)
+
+    # Structured data for the application itself
+    app_data = {
+        **_WEB_APPLICATION_LD,
+        "name": app_name,
+        "description": app_description,
+        "url": base_url,
+        "operatingSystem": "Any",
+    }
 
     # Build navigation structure for AI
     nav_structure = {
@@ -207,7 +265,8 @@ def generate_index_template(app_config: Dict, pages: List[Dict]) -> str:
     page_list_items = []
     for p in pages:
         page_list_items.append(
-            f'<li><a href="{p.get("path", "/")}">{p.get("name", "Page")}</a> - {p.get("description", "")}</li>'
+            f'<li><a href="{p.get("path", "/")}">{_esc(p.get("name", "Page"))}</a>'
+            f' - {_esc(p.get("description", ""))}</li>'
         )
 
     template = f"""<!DOCTYPE html>
@@ -226,25 +285,17 @@ def generate_index_template(app_config: Dict, pages: List[Dict]) -> str:
 
     <!-- Open Graph / Social -->
     <meta property="og:type" content="website">
-    <meta property="og:title" content="{app_name}">
-    <meta property="og:description" content="{app_description}">
+    <meta property="og:title" content="{app_name_html}">
+    <meta property="og:description" content="{app_description_html}">
 
     <!-- Structured Data for AI -->
     <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "WebApplication",
-        "name": "{app_name}",
-        "description": "{app_description}",
-        "url": "{base_url}",
-        "applicationCategory": "BusinessApplication",
-        "operatingSystem": "Any"
-    }}
+    {_ld_json(app_data)}
     </script>
 
     <!-- Navigation Structure for AI -->
     <script type="application/ld+json">
-    {json.dumps(nav_structure, indent=2)}
+    {_ld_json(nav_structure)}
     </script>
 
     {{%favicon%}}
@@ -254,8 +305,8 @@ def generate_index_template(app_config: Dict, pages: List[Dict]) -> str:
     <!-- Graceful degradation for non-JS agents -->
     <noscript>
         <div style="padding: 20px; max-width: 800px; margin: 0 auto; font-family: sans-serif;">
-            <h1>{app_name}</h1>
-            <p>{app_description}</p>
+            <h1>{app_name_html}</h1>
+            <p>{app_description_html}</p>
             <p><strong>This application requires JavaScript for interactive features.</strong></p>
 
             <h2>Available Resources:</h2>
@@ -5,7 +5,90 @@ This module provides functionality to generate robots.txt files with
 fine-grained control over different types of bots (training, search, traditional).
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+
+# Fixed sections of robots.txt, built once at import
+_HEADER_LINES = (
+    "# Robots.txt for Dash Application",
+    "# Generated by dash-improve-my-llms",
+    "# https://pip-install-python.com",
+    "",
+    "# Default policy - allow all standard crawlers",
+    "User-agent: *",
+    "Allow: /",
+    "",
+)
+
+_AI_TRAINING_BLOCK_LINES = (
+    "# ==========================================",
+    "# Block AI Training Data Collection",
+    "# ==========================================",
+    "# These bots collect data to train AI models.",
+    "# Blocking them prevents your content from being",
+    "# used in training datasets without permission.",
+    "",
+    "User-agent: GPTBot",
+    "Disallow: /",
+    "",
+    "User-agent: anthropic-ai",
+    "Disallow: /",
+    "",
+    "User-agent: Claude-Web",
+    "Disallow: /",
+    "",
+    "User-agent: CCBot",
+    "Disallow: /",
+    "",
+    "User-agent: Google-Extended",
+    "Disallow: /",
+    "",
+    "User-agent: FacebookBot",
+    "Disallow: /",
+    "",
+    "User-agent: Omgilibot",
+    "Disallow: /",
+    "",
+    "User-agent: Omgili",
+    "Disallow: /",
+    "",
+    "User-agent: ByteSpider",
+    "Disallow: /",
+    "",
+)
+
+_AI_SEARCH_ALLOW_LINES = (
+    "# ==========================================",
+    "# Allow AI Search and Citation Bots",
+    "# ==========================================",
+    "# These bots help users find your content through",
+    "# AI-powered search engines and assistants.",
+    "",
+    "User-agent: ChatGPT-User",
+    "Allow: /",
+    "",
+    "User-agent: ClaudeBot",
+    "Allow: /",
+    "",
+    "User-agent: PerplexityBot",
+    "Allow: /",
+    "",
+    "User-agent: OAI-SearchBot",
+    "Disallow: /",
+    "",
+)
+
+_TRADITIONAL_LINES = (
+    "# ==========================================",
+    "# Traditional Search Engines",
+    "# ==========================================",
+    "# Standard search engine bots are allowed",
+    "# by default with the User-agent: * rule above.",
+    "",
+    "# Googlebot, Bingbot, etc. - covered by *",
+    "",
+)
 
 
 class RobotsConfig:
@@ -38,6 +121,17 @@ class RobotsConfig:
         self.custom_rules = custom_rules or []
         self.disallowed_paths = disallowed_paths or []
 
+    def _cache_key(self) -> Tuple:
+        """Snapshot of the current settings, so later edits to the config are seen."""
+        return (
+            self.block_ai_training,
+            self.allow_ai_search,
+            self.allow_traditional,
+            self.crawl_delay,
+            tuple(self.custom_rules),
+            tuple(self.disallowed_paths),
+        )
+
 
 def generate_robots_txt(
     config: RobotsConfig, sitemap_url: str, base_url: str
@@ -53,118 +147,54 @@ def generate_robots_txt(
     Returns:
         Complete robots.txt content
     """
-
-    lines = [
-        "# Robots.txt for Dash Application",
-        "# Generated by dash-improve-my-llms",
-        "# https://pip-install-python.com",
-        "",
-        "# Default policy - allow all standard crawlers",
-        "User-agent: *",
-        "Allow: /",
-        "",
-    ]
+    # robots.txt is requested far more often than its inputs change
+    return _render_robots_txt(*config._cache_key(), sitemap_url, base_url)
+
+
+@lru_cache(maxsize=64)
+def _render_robots_txt(
+    block_ai_training: bool,
+    allow_ai_search: bool,
+    allow_traditional: bool,
+    crawl_delay: Optional[int],
+    custom_rules: Tuple[str, ...],
+    disallowed_paths: Tuple[str, ...],
+    sitemap_url: str,
+    base_url: str,
+) -> str:
+    lines = list(_HEADER_LINES)
 
     # Add disallowed paths for all bots
-    if config.disallowed_paths:
-        for path in config.disallowed_paths:
+    if disallowed_paths:
+        for path in disallowed_paths:
             lines.append(f"Disallow: {path}")
         lines.append("")
 
     # Add crawl delay if specified
-    if config.crawl_delay:
-        lines.extend([f"Crawl-delay: {config.crawl_delay}", ""])
+    if crawl_delay:
+        lines.extend([f"Crawl-delay: {crawl_delay}", ""])
 
     # Block AI training bots if configured
-    if config.block_ai_training:
-        lines.extend(
-            [
-                "# ==========================================",
-                "# Block AI Training Data Collection",
-                "# ==========================================",
-                "# These bots collect data to train AI models.",
-                "# Blocking them prevents your content from being",
-                "# used in training datasets without permission.",
-                "",
-                "User-agent: GPTBot",
-                "Disallow: /",
-                "",
-                "User-agent: anthropic-ai",
-                "Disallow: /",
-                "",
-                "User-agent: Claude-Web",
-                "Disallow: /",
-                "",
-                "User-agent: CCBot",
-                "Disallow: /",
-                "",
-                "User-agent: Google-Extended",
-                "Disallow: /",
-                "",
-                "User-agent: FacebookBot",
-                "Disallow: /",
-                "",
-                "User-agent: Omgilibot",
-                "Disallow: /",
-                "",
-                "User-agent: Omgili",
-                "Disallow: /",
-                "",
-                "User-agent: ByteSpider",
-                "Disallow: /",
-                "",
-            ]
-        )
+    if block_ai_training:
+        lines.extend(_AI_TRAINING_BLOCK_LINES)
 
     # Allow AI search/citation bots if configured
-    if config.allow_ai_search:
-        lines.extend(
-            [
-                "# ==========================================",
-                "# Allow AI Search and Citation Bots",
-                "# ==========================================",
-                "# These bots help users find your content through",
-                "# AI-powered search engines and assistants.",
-                "",
-                "User-agent: ChatGPT-User",
-                "Allow: /",
-                "",
-                "User-agent: ClaudeBot",
-                "Allow: /",
-                "",
-                "User-agent: PerplexityBot",
-                "Allow: /",
-                "",
-                "User-agent: OAI-SearchBot",
-                "Disallow: /",
-                "",
-            ]
-        )
+    if allow_ai_search:
+        lines.extend(_AI_SEARCH_ALLOW_LINES)
 
     # Allow traditional search bots (usually always allowed)
-    if config.allow_traditional:
-        lines.extend(
-            [
-                "# ==========================================",
-                "# Traditional Search Engines",
-                "# ==========================================",
-                "# Standard search engine bots are allowed",
-                "# by default with the User-agent: * rule above.",
-                "",
-                "# Googlebot, Bingbot, etc. - covered by *",
-                "",
-            ]
-        )
+    if allow_traditional:
+        lines.extend(_TRADITIONAL_LINES)
 
     # Add custom rules
-    if config.custom_rules:
+    if custom_rules:
         lines.extend(
             [
                 "# ==========================================",
                 "# Custom Rules",
                 "# ==========================================",
                 "",
-                *config.custom_rules,
+                *custom_rules,
                 "",
             ]
         )
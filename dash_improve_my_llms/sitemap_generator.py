@@ -5,13 +5,29 @@ This module provides functionality to automatically generate sitemaps
 from Dash page registry with intelligent priority and frequency inference.
 """
 
+import gzip
+import io
+import os
+import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+
+# XML's five predefined entities, applied in one str.translate pass
+_XML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
 
 
 class SitemapEntry:
     """Represents a single URL in the sitemap."""
 
+    # One instance per URL, so skip the per-instance __dict__
+    __slots__ = ("loc", "lastmod", "changefreq", "priority")
+
     def __init__(
         self,
         loc: str,
@@ -40,23 +56,51 @@ class SitemapEntry:
         Returns:
             XML string for this sitemap entry
         """
-        xml = [
-            "  <url>",
-            f"    <loc>{self.loc}</loc>",
-            f"    <lastmod>{self.lastmod}</lastmod>",
-        ]
+        # Only add changefreq/priority if they're set and not None
+        changefreq = (
+            f"\n    <changefreq>{self.changefreq}</changefreq>"
+            if self.changefreq is not None
+            else ""
+        )
+        priority = (
+            f"\n    <priority>{self.priority:.1f}</priority>" if self.priority is not None else ""
+        )
 
-        # Only add changefreq if it's set and not None
-        if self.changefreq is not None:
-            xml.append(f"    <changefreq>{self.changefreq}</changefreq>")
+        return (
+            "  <url>\n"
+            f"    <loc>{self.loc.translate(_XML_ESCAPE_TABLE)}</loc>\n"
+            f"    <lastmod>{self.lastmod}</lastmod>"
+            f"{changefreq}{priority}\n"
+            "  </url>"
+        )
 
-        # Only add priority if it's set and not None
-        if self.priority is not None:
-            xml.append(f"    <priority>{self.priority:.1f}</priority>")
 
-        xml.append("  </url>")
+def _keywords_re(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation matching any of them as a substring."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
 
-        return "\n".join(xml)
+
+# Page paths are a small, fixed set per app, so the path classifiers cache results
+_CACHE_SIZE = 2048
+
+# Priority tiers, checked in order so a higher tier wins when a path matches several
+_PRIORITY_TIERS = (
+    (_keywords_re(["dashboard", "main", "overview", "home"]), 0.9),
+    (_keywords_re(["report", "analytics", "data", "view"]), 0.8),
+    (_keywords_re(["about", "help", "docs", "api", "settings"]), 0.7),
+)
+
+# Change frequency tiers, checked in the same first-match order
+_CHANGEFREQ_TIERS = (
+    # Real-time data pages
+    (_keywords_re(["dashboard", "live", "real-time", "realtime"]), "daily"),
+    # Regular content
+    (_keywords_re(["report", "analytics", "data"]), "weekly"),
+    # Documentation
+    (_keywords_re(["docs", "api", "help", "guide"]), "monthly"),
+    # Static pages
+    (_keywords_re(["about", "contact", "terms", "privacy"]), "yearly"),
+)
 
 
 def infer_page_priority(path: str, metadata: Dict) -> float:
@@ -77,23 +121,19 @@ def infer_page_priority(path: str, metadata: Dict) -> float:
     Returns:
         Priority value between 0.0 and 1.0
     """
+    return _classify_path(path)[0]
+
+
+def _path_priority(path: str) -> float:
     # Homepage always highest
     if path == "/":
         return 1.0
 
     # Check for keywords in path
-    high_priority_keywords = ["dashboard", "main", "overview", "home"]
-    medium_priority_keywords = ["report", "analytics", "data", "view"]
-    low_priority_keywords = ["about", "help", "docs", "api", "settings"]
-
     path_lower = path.lower()
-
-    if any(kw in path_lower for kw in high_priority_keywords):
-        return 0.9
-    elif any(kw in path_lower for kw in medium_priority_keywords):
-        return 0.8
-    elif any(kw in path_lower for kw in low_priority_keywords):
-        return 0.7
+    for pattern, priority in _PRIORITY_TIERS:
+        if pattern.search(path_lower):
+            return priority
 
     return 0.5
 
@@ -111,25 +151,22 @@ def infer_change_frequency(path: str, metadata: Dict) -> str:
     Returns:
         Change frequency string
     """
-    path_lower = path.lower()
+    return _classify_path(path)[1]
 
-    # Real-time data pages
-    if any(kw in path_lower for kw in ["dashboard", "live", "real-time", "realtime"]):
-        return "daily"
 
-    # Regular content
-    if any(kw in path_lower for kw in ["report", "analytics", "data"]):
-        return "weekly"
+def _path_change_frequency(path: str) -> str:
+    path_lower = path.lower()
+    for pattern, changefreq in _CHANGEFREQ_TIERS:
+        if pattern.search(path_lower):
+            return changefreq
 
-    # Documentation
-    if any(kw in path_lower for kw in ["docs", "api", "help", "guide"]):
-        return "monthly"
+    return "weekly"
 
-    # Static pages
-    if any(kw in path_lower for kw in ["about", "contact", "terms", "privacy"]):
-        return "yearly"
 
-    return "weekly"
+@lru_cache(maxsize=_CACHE_SIZE)
+def _classify_path(path: str) -> Tuple[float, str]:
+    """(priority, changefreq) for a path; only the path is used, so results are cached."""
+    return _path_priority(path), _path_change_frequency(path)
 
 
 def generate_sitemap_xml(
@@ -150,9 +187,112 @@ def generate_sitemap_xml(
     Returns:
         Complete sitemap.xml content
     """
+    if custom_entries:
+        return "".join(iter_sitemap_xml(pages, base_url, custom_entries, hidden_paths))
+
+    # Pages contribute only their path and hidden flag, so the rendered sitemap
+    # is cached on those (plus today's date for lastmod) across requests
+    page_keys = tuple((page.get("path", ""), bool(page.get("hidden", False))) for page in pages)
+    return _cached_sitemap_xml(
+        page_keys,
+        base_url,
+        frozenset(hidden_paths or ()),
+        datetime.now().strftime("%Y-%m-%d"),
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_sitemap_xml(
+    page_keys: Tuple[Tuple[str, bool], ...],
+    base_url: str,
+    hidden_paths: FrozenSet[str],
+    today: str,
+) -> str:
+    pages = [{"path": path, "hidden": hidden} for path, hidden in page_keys]
+    entries = _collect_entries(pages, base_url, None, hidden_paths, today)
+    return "".join(_xml_chunks(entries))
 
-    hidden_paths = hidden_paths or []
-    entries = []
+
+def generate_sitemap_xml_gz(
+    pages: List[Dict],
+    base_url: str,
+    custom_entries: Optional[List[SitemapEntry]] = None,
+    hidden_paths: Optional[List[str]] = None,
+) -> bytes:
+    """
+    Generate a gzip-compressed sitemap.xml, e.g. to publish as sitemap.xml.gz.
+
+    The gzip header carries no timestamp, so identical sitemaps compress to
+    identical bytes.
+
+    Args:
+        pages: List of page metadata from register_page_metadata()
+        base_url: Base URL of the application
+        custom_entries: Additional custom entries to include
+        hidden_paths: List of paths to exclude from sitemap
+
+    Returns:
+        Gzip-compressed sitemap.xml content
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=6, mtime=0) as f:
+        for chunk in iter_sitemap_xml(pages, base_url, custom_entries, hidden_paths):
+            f.write(chunk.encode("utf-8"))
+    return buf.getvalue()
+
+
+def iter_sitemap_xml(
+    pages: List[Dict],
+    base_url: str,
+    custom_entries: Optional[List[SitemapEntry]] = None,
+    hidden_paths: Optional[List[str]] = None,
+) -> Iterator[str]:
+    """
+    Generate sitemap.xml in chunks, one per URL, instead of as a single string.
+
+    The chunks concatenate to exactly what generate_sitemap_xml() returns, so
+    they can be written to a file or streamed as a response body without
+    holding the whole document in memory.
+
+    Args:
+        pages: List of page metadata from register_page_metadata()
+        base_url: Base URL of the application
+        custom_entries: Additional custom entries to include
+        hidden_paths: List of paths to exclude from sitemap
+
+    Returns:
+        Iterator over consecutive pieces of the sitemap.xml content
+    """
+    entries = _collect_entries(pages, base_url, custom_entries, hidden_paths)
+    return _xml_chunks(entries)
+
+
+def _xml_chunks(entries: List[SitemapEntry]) -> Iterator[str]:
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n\n'
+    )
+    for entry in entries:
+        yield entry.to_xml() + "\n\n"
+    yield "</urlset>"
+
+
+def _collect_entries(
+    pages: List[Dict],
+    base_url: str,
+    custom_entries: Optional[List[SitemapEntry]],
+    hidden_paths: Optional[List[str]],
+    today: Optional[str] = None,
+) -> List[SitemapEntry]:
+    """Build the sitemap's entries, one per URL, sorted by priority (highest first)."""
+    # A set keeps the per-page check O(1) however many paths are hidden
+    hidden_paths = set(hidden_paths or ())
+    # Join with exactly one slash whether or not base_url/path carry their own
+    base = base_url.rstrip("/")
+    # One entry per URL; a repeated URL keeps its highest-priority entry
+    entries_by_loc = {}
+    # Same default SitemapEntry would use, formatted once rather than per page
+    today = today or datetime.now().strftime("%Y-%m-%d")
 
     # Add entries for registered pages
     for page in pages:
@@ -166,31 +306,56 @@ def generate_sitemap_xml(
         if page.get("hidden", False):
             continue
 
-        entry = SitemapEntry(
-            loc=f"{base_url}{path}",
-            priority=infer_page_priority(path, page),
-            changefreq=infer_change_frequency(path, page),
+        # Priority depends only on the path, so the first page for a URL wins
+        loc = f"{base}/{path.lstrip('/')}" if path else base
+        if loc in entries_by_loc:
+            continue
+
+        priority, changefreq = _classify_path(path)
+        entries_by_loc[loc] = SitemapEntry(
+            loc=loc, lastmod=today, priority=priority, changefreq=changefreq
         )
-        entries.append(entry)
 
     # Add custom entries
-    if custom_entries:
-        entries.extend(custom_entries)
+    for entry in custom_entries or ():
+        existing = entries_by_loc.get(entry.loc)
+        if existing is None or (entry.priority or 0.0) > (existing.priority or 0.0):
+            entries_by_loc[entry.loc] = entry
 
     # Sort by priority (highest first)
-    entries.sort(key=lambda e: e.priority, reverse=True)
+    return sorted(entries_by_loc.values(), key=attrgetter("priority"), reverse=True)
 
-    # Build XML
-    xml = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-        "",
-    ]
 
-    for entry in entries:
-        xml.append(entry.to_xml())
-        xml.append("")
+def write_sitemap(
+    path: Union[str, Path],
+    pages: List[Dict],
+    base_url: str,
+    custom_entries: Optional[List[SitemapEntry]] = None,
+    hidden_paths: Optional[List[str]] = None,
+) -> Path:
+    """
+    Write sitemap.xml to disk, e.g. from a deploy step or scheduled job.
+
+    The file is written under a temporary name and then moved into place, so a
+    web server serving it statically never sees a half-written sitemap.
 
-    xml.append("</urlset>")
+    Args:
+        path: Destination file path
+        pages: List of page metadata from register_page_metadata()
+        base_url: Base URL of the application
+        custom_entries: Additional custom entries to include
+        hidden_paths: List of paths to exclude from sitemap
 
-    return "\n".join(xml)
\ No newline at end of file
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(iter_sitemap_xml(pages, base_url, custom_entries, hidden_paths))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
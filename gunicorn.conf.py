@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for serving the example app in production.
+
+Run with: gunicorn app:server
+(`python app.py` still starts the Werkzeug development server.)
+"""
+
+import os
+
+bind = "0.0.0.0:8959"
+
+# Import the app once in the master so workers share the layout copy-on-write.
+# app.py reopens its SQLite visit log and restarts its tracking threads in each worker.
+preload_app = True
+
+# Threaded workers suit Dash's I/O-bound callback traffic
+worker_class = "gthread"
+workers = 2 * (os.cpu_count() or 1) + 1
+threads = 4
@@ -6,7 +6,7 @@ This page demonstrates:
 2. Visitor tracking - Desktop, Mobile, Tablet, and Bot visits
 3. Bot type detection - Identifies AI training, AI search, and traditional bots
 4. Plotly visualizations - Beautiful graphs showing analytics
-5. Real-time data - Updates on page refresh
+5. Real-time data - Refreshes every 30 seconds while the page is open
 
 This page won't appear in:
 - sitemap.xml
@@ -20,10 +20,15 @@ from dash import Input, Output, callback, dcc, html, register_page
 from dash_improve_my_llms import mark_hidden, register_page_metadata
 import plotly.graph_objects as go
 import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
-from pathlib import Path
+import sqlite3
+import threading
+import time
 from collections import Counter
+from functools import lru_cache, wraps
+from itertools import compress
+from pathlib import Path
 
 # Register page
 register_page(
@@ -42,196 +47,255 @@ register_page_metadata(
 # HIDE THIS PAGE FROM AI BOTS AND SEARCH ENGINES (NEW v0.2.0!)
 mark_hidden("/admin")
 
-# Path to analytics data
-ANALYTICS_FILE = Path(__file__).parent.parent / "visitor_analytics.json"
+# Path to analytics data (written by the visitor tracker in app.py)
+ANALYTICS_DB = Path(__file__).parent.parent / "visitor_analytics.db"
+_ANALYTICS_PATH = str(ANALYTICS_DB)
+
+# The log is never deleted while the app runs, so its existence is checked until first seen
+_db_exists = False
+
+# Number of most recent visits used for the charts, and of bot visits in the table
+RECENT_VISITS = 1000
+RECENT_BOT_VISITS = 20
+
+# How often an open dashboard re-queries the analytics
+REFRESH_INTERVAL_MS = 30_000
+
+# Read connection reused across renders, and the last result keyed by the database's
+# data_version (which changes whenever another connection commits visits)
+_conn = None
+_cache = {"key": None, "data": None}
+_cache_lock = threading.Lock()
+
+
+def _visit(row):
+    ts, path, device_type, bot_type, user_agent = row
+    return {
+        "timestamp": ts,
+        "path": path,
+        "device_type": device_type,
+        "bot_type": bot_type,
+        "user_agent": user_agent,
+    }
+
+
+def _empty_stats():
+    return {
+        "desktop": 0,
+        "mobile": 0,
+        "tablet": 0,
+        "bot": 0,
+        "total": 0
+    }
 
 
 def load_analytics():
-    """Load analytics data from JSON file."""
-    if ANALYTICS_FILE.exists():
-        with open(ANALYTICS_FILE, "r") as f:
-            data = json.load(f)
-
-            # Clean up any _reload-hash or internal Dash paths from existing data
-            clean_visits = []
-            for visit in data.get("visits", []):
-                path = visit.get("path", "")
-                # Filter out internal Dash paths
-                if not any(ext in path for ext in ['.css', '.js', '.png', '.jpg', '.ico', '_dash', '_reload-hash']):
-                    clean_visits.append(visit)
-
-            # Recalculate stats from clean visits
-            stats = {
-                "desktop": 0,
-                "mobile": 0,
-                "tablet": 0,
-                "bot": 0,
-                "total": 0
-            }
+    """Load visit counts and the most recent visits from the SQLite visit log.
 
-            for visit in clean_visits:
-                device_type = visit.get("device_type", "desktop")
-                stats[device_type] = stats.get(device_type, 0) + 1
-                stats["total"] += 1
+    The result is cached until the tracker commits new visits.
+    """
+    global _db_exists, _conn
 
+    if not _db_exists:
+        if not ANALYTICS_DB.exists():
             return {
-                "visits": clean_visits,
-                "stats": stats
+                "visits": {"paths": (), "devices": (), "bot_types": ()},
+                "stats": _empty_stats(),
+                "hourly": [],
+                "recent_bots": [],
             }
-
-    return {
-        "visits": [],
-        "stats": {
-            "desktop": 0,
-            "mobile": 0,
-            "tablet": 0,
-            "bot": 0,
-            "total": 0
+        _db_exists = True
+
+    # Dash callbacks and page renders run on multiple threads
+    with _cache_lock:
+        if _conn is None:
+            _conn = sqlite3.connect(_ANALYTICS_PATH, check_same_thread=False)
+
+        current_hour = int(time.time() // 3600)
+        key = (_conn.execute("PRAGMA data_version").fetchone()[0], current_hour)
+        if key == _cache["key"]:
+            return _cache["data"]
+
+        # Totals and the hourly chart come from the aggregates kept by the tracker
+        stats = _empty_stats()
+        for device_type, count in _conn.execute("SELECT device, n FROM visits_totals"):
+            stats[device_type] = count
+            stats["total"] += count
+
+        # One row per hour with the device counts pivoted into columns
+        hourly = _conn.execute(
+            "SELECT hour, "
+            "SUM(CASE device WHEN 'desktop' THEN n ELSE 0 END), "
+            "SUM(CASE device WHEN 'mobile' THEN n ELSE 0 END), "
+            "SUM(CASE device WHEN 'tablet' THEN n ELSE 0 END), "
+            "SUM(CASE device WHEN 'bot' THEN n ELSE 0 END) "
+            "FROM visits_hourly WHERE hour > ? GROUP BY hour",
+            (current_hour - 24,),
+        ).fetchall()
+
+        # Only the columns the summaries need, stored as one list per column
+        rows = _conn.execute(
+            "SELECT path, device, bot_type FROM visits ORDER BY rowid DESC LIMIT ?",
+            (RECENT_VISITS,),
+        ).fetchall()
+        paths, devices, bot_types = zip(*rows) if rows else ((), (), ())
+
+        # Newest first; walks the device index backwards and stops after RECENT_BOT_VISITS.
+        # SQLite formats the epoch timestamps, so the table needs no per-row parsing.
+        bot_rows = _conn.execute(
+            "SELECT strftime('%Y-%m-%d %H:%M:%S', ts, 'unixepoch', 'localtime'), "
+            "path, device, bot_type, ua FROM visits WHERE device = 'bot' "
+            "ORDER BY rowid DESC LIMIT ?",
+            (RECENT_BOT_VISITS,),
+        ).fetchall()
+
+        _cache["key"] = key
+        _cache["data"] = {
+            "visits": {"paths": paths, "devices": devices, "bot_types": bot_types},
+            "stats": stats,
+            "hourly": hourly,
+            "recent_bots": [_visit(row) for row in bot_rows],
         }
-    }
+        return _cache["data"]
 
 
-def get_bot_visits_by_type(visits):
-    """Get bot visits grouped by bot type."""
-    bot_visits = [v for v in visits if v["device_type"] == "bot"]
-    bot_types = Counter([v.get("bot_type", "unknown") for v in bot_visits])
-    return bot_types
+def get_visits_by_hour(hourly):
+    """Get (hour label, desktop, mobile, tablet, bot) rows for the last 24 hours.
 
+    hourly holds (epoch hour, desktop, mobile, tablet, bot) rows; hours without
+    visits are filled with zeros.
+    """
+    # Place rows by integer offset from the oldest hour; labels are formatted once per slot
+    first_hour = int(time.time() // 3600) - 23
+    slots = [(0, 0, 0, 0)] * 24
 
-def get_visits_by_hour(visits):
-    """Get visits grouped by hour for the last 24 hours."""
-    now = datetime.now()
-    twenty_four_hours_ago = now - timedelta(hours=24)
+    for hour, *counts in hourly:
+        offset = hour - first_hour
+        if 0 <= offset < 24:
+            slots[offset] = tuple(counts)
 
-    # Filter visits from last 24 hours
-    recent_visits = []
-    for visit in visits:
-        try:
-            visit_time = datetime.fromisoformat(visit["timestamp"])
-            if visit_time >= twenty_four_hours_ago:
-                recent_visits.append(visit)
-        except:
-            continue
+    return tuple(
+        (datetime.fromtimestamp((first_hour + offset) * 3600).strftime("%H:00"),) + slot
+        for offset, slot in enumerate(slots)
+    )
 
-    # Group by hour
-    hourly_counts = {}
-    for i in range(24):
-        hour = (now - timedelta(hours=23-i)).strftime("%H:00")
-        hourly_counts[hour] = {"desktop": 0, "mobile": 0, "tablet": 0, "bot": 0}
 
-    for visit in recent_visits:
-        try:
-            visit_time = datetime.fromisoformat(visit["timestamp"])
-            hour_key = visit_time.strftime("%H:00")
-            device_type = visit["device_type"]
-            if hour_key in hourly_counts:
-                hourly_counts[hour_key][device_type] += 1
-        except:
-            continue
+def summarize_visits(visits, limit=10):
+    """Count bot visits by bot type and find the most visited pages.
 
-    return hourly_counts
+    visits holds one tuple per column ("paths", "devices", "bot_types"), so both
+    counts run over flat sequences in C instead of looking up keys per visit.
+    """
+    bot_types = Counter(compress(visits["bot_types"], map("bot".__eq__, visits["devices"])))
 
+    # Dash internal and asset paths are dropped by the tracker before they are stored
+    page_counts = Counter(visits["paths"])
 
-def get_top_pages(visits, limit=10):
-    """Get most visited pages."""
-    page_counts = Counter([v["path"] for v in visits if v["path"] not in ["/_dash-update-component", "/_dash-layout"]])
-    return page_counts.most_common(limit)
+    return bot_types, page_counts.most_common(limit)
 
 
-def layout():
-    analytics = load_analytics()
+def compute_dashboard(analytics):
+    """Build the data-driven parts of the dashboard (stat cards, figures, bot table)."""
     visits = analytics["visits"]
     stats = analytics["stats"]
-    bot_types = get_bot_visits_by_type(visits)
-    hourly_data = get_visits_by_hour(visits)
-    top_pages = get_top_pages(visits)
+    bot_types, top_pages = summarize_visits(visits)
+    hourly_data = get_visits_by_hour(analytics["hourly"])
+
+    # Recent bot visits with details, newest first
+    recent_bot_visits = analytics["recent_bots"]
+
+    return (
+        [
+            create_stat_card(
+                value=stats['total'],
+                label="Total Visits",
+                icon="📊",
+                color="violet"
+            ),
+            create_stat_card(
+                value=stats['desktop'],
+                label="Desktop",
+                icon="🖥️",
+                color="gray"
+            ),
+            create_stat_card(
+                value=stats['mobile'],
+                label="Mobile",
+                icon="📱",
+                color="gray"
+            ),
+            create_stat_card(
+                value=stats['tablet'],
+                label="Tablet",
+                icon="📲",
+                color="gray"
+            ),
+            create_stat_card(
+                value=stats['bot'],
+                label="Bots",
+                icon="🤖",
+                color="gray"
+            ),
+        ],
+        create_device_pie_chart(
+            (stats['desktop'], stats['mobile'], stats['tablet'], stats['bot'])
+        ),
+        create_bot_types_chart(tuple(bot_types.items())),
+        create_hourly_chart(hourly_data),
+        create_top_pages_chart(tuple(top_pages)),
+        create_bot_visits_table(recent_bot_visits) if recent_bot_visits else dmc.Text(
+            "No bot visits yet. Bots will be tracked automatically.",
+            c="dimmed",
+            fs="italic"
+        ),
+    )
+
 
-    # Get recent bot visits with details
-    recent_bot_visits = [v for v in visits if v["device_type"] == "bot"][-20:]
-    recent_bot_visits.reverse()
+# Outputs for the last analytics snapshot; load_analytics() returns the same object
+# until new visits are committed, so every open dashboard shares one computation
+_dashboard = {"analytics": None, "outputs": None}
 
+
+@callback(
+    Output("admin-stats", "children"),
+    Output("admin-device-chart", "figure"),
+    Output("admin-bot-types-chart", "figure"),
+    Output("admin-hourly-chart", "figure"),
+    Output("admin-top-pages-chart", "figure"),
+    Output("admin-bot-table", "children"),
+    Input("admin-refresh", "n_intervals"),
+)
+def refresh_dashboard(n_intervals):
+    """Fill in the dashboard on page load and every REFRESH_INTERVAL_MS after."""
+    analytics = load_analytics()
+    with _cache_lock:
+        if _dashboard["analytics"] is not analytics:
+            _dashboard["outputs"] = compute_dashboard(analytics)
+            _dashboard["analytics"] = analytics
+        return _dashboard["outputs"]
+
+
+def layout():
+    # Only the skeleton is rendered here; refresh_dashboard() fills in the data
     return dmc.Container([
-        # Header Section - Improved visual hierarchy
-        dmc.Stack([
-            dmc.Group([
-                dmc.Stack([
-                    dmc.Title("Admin Dashboard", order=1, c="gray.9"),
-                    dmc.Text(
-                        "Visitor Analytics & Bot Tracking",
-                        size="lg",
-                        c="dimmed"
-                    ),
-                ], gap=4),
-                dmc.Stack([
-                    dmc.Badge("Hidden Page", color="red", size="lg", variant="filled"),
-                    dmc.Text("Not in sitemap.xml", size="xs", c="dimmed"),
-                ], gap=4, align="flex-end"),
-            ], justify="space-between", align="flex-start"),
-
-            # Info Alert - Better clarity
-            dmc.Alert(
-                children=[
-                    dmc.Text([
-                        "This page demonstrates ",
-                        dmc.Code("mark_hidden()"),
-                        " functionality. It's excluded from sitemaps, blocked in robots.txt, and returns 404 for AI bot documentation requests."
-                    ], size="sm"),
-                ],
-                title="🔒 Privacy Control Demo",
-                color="blue",
-                variant="light",
-                radius="md",
-            ),
-        ], gap="xl", mb="xl"),
+        dcc.Interval(id="admin-refresh", interval=REFRESH_INTERVAL_MS),
+
+        _HEADER,
 
         # Stats Cards Section - Improved spacing and visual hierarchy
         dmc.SimpleGrid(
+            id="admin-stats",
             cols={"base": 1, "xs": 2, "sm": 3, "md": 5},
             spacing="lg",
             mb="xl",
-            children=[
-                create_stat_card(
-                    value=stats['total'],
-                    label="Total Visits",
-                    icon="📊",
-                    color="violet"
-                ),
-                create_stat_card(
-                    value=stats['desktop'],
-                    label="Desktop",
-                    icon="🖥️",
-                    color="gray"
-                ),
-                create_stat_card(
-                    value=stats['mobile'],
-                    label="Mobile",
-                    icon="📱",
-                    color="gray"
-                ),
-                create_stat_card(
-                    value=stats['tablet'],
-                    label="Tablet",
-                    icon="📲",
-                    color="gray"
-                ),
-                create_stat_card(
-                    value=stats['bot'],
-                    label="Bots",
-                    icon="🤖",
-                    color="gray"
-                ),
-            ]
+            children=[]
         ),
 
         # Main Content - Tabs for progressive disclosure
         dmc.Tabs(
             value="overview",
             children=[
-                dmc.TabsList([
-                    dmc.TabsTab("Overview", value="overview"),
-                    dmc.TabsTab("Bot Activity", value="bots"),
-                    dmc.TabsTab("Configuration", value="config"),
-                ]),
+                _TABS_LIST,
 
                 # Overview Tab
                 dmc.TabsPanel(value="overview", pt="xl", children=[
@@ -245,12 +309,12 @@ def layout():
                                 create_chart_card(
                                     title="Device Distribution",
                                     description="Breakdown by device type",
-                                    chart=create_device_pie_chart(stats)
+                                    graph_id="admin-device-chart"
                                 ),
                                 create_chart_card(
                                     title="Bot Types",
                                     description="AI Training, Search, and Traditional bots",
-                                    chart=create_bot_types_chart(bot_types)
+                                    graph_id="admin-bot-types-chart"
                                 ),
                             ]
                         ),
@@ -259,14 +323,14 @@ def layout():
                         create_chart_card(
                             title="Visits by Hour",
                             description="Activity over the last 24 hours",
-                            chart=create_hourly_chart(hourly_data)
+                            graph_id="admin-hourly-chart"
                         ),
 
                         # Top pages chart
                         create_chart_card(
                             title="Most Visited Pages",
                             description="Top 10 pages by visit count",
-                            chart=create_top_pages_chart(top_pages)
+                            graph_id="admin-top-pages-chart"
                         ),
                     ], gap="lg"),
                 ]),
@@ -274,82 +338,21 @@ def layout():
                 # Bot Activity Tab
                 dmc.TabsPanel(value="bots", pt="xl", children=[
                     dmc.Stack([
-                        dmc.Alert(
-                            children="Track AI training bots, AI search bots, and traditional search engines visiting your application.",
-                            title="Bot Monitoring",
-                            color="blue",
-                            variant="light",
-                        ),
+                        _BOT_MONITORING_ALERT,
 
                         dmc.Paper([
                             dmc.Title("Recent Bot Visits", order=3, mb="md"),
-                            create_bot_visits_table(recent_bot_visits) if recent_bot_visits else dmc.Text(
-                                "No bot visits yet. Bots will be tracked automatically.",
-                                c="dimmed",
-                                fs="italic"
-                            ),
+                            html.Div(id="admin-bot-table"),
                         ], p="lg", radius="md", withBorder=True),
                     ], gap="lg"),
                 ]),
 
-                # Configuration Tab
-                dmc.TabsPanel(value="config", pt="xl", children=[
-                    dmc.Stack([
-                        # Bot Type Reference
-                        dmc.Paper([
-                            dmc.Title("Bot Type Reference", order=3, mb="lg"),
-                            dmc.SimpleGrid(
-                                cols={"base": 1, "sm": 3},
-                                spacing="lg",
-                                children=[
-                                    create_bot_type_info(
-                                        "AI Training",
-                                        "GPTBot, anthropic-ai, Claude-Web, CCBot, Google-Extended",
-                                        "🚫 Blocked by default",
-                                        "red"
-                                    ),
-                                    create_bot_type_info(
-                                        "AI Search",
-                                        "ChatGPT-User, ClaudeBot, PerplexityBot",
-                                        "✅ Allowed by default",
-                                        "blue"
-                                    ),
-                                    create_bot_type_info(
-                                        "Traditional",
-                                        "Googlebot, Bingbot, Yahoo, DuckDuckBot",
-                                        "✅ Allowed by default",
-                                        "green"
-                                    ),
-                                ]
-                            ),
-                        ], p="lg", radius="md", withBorder=True, mb="lg"),
-
-                        # Current Configuration
-                        dmc.Paper([
-                            dmc.Title("Current Configuration", order=3, mb="md"),
-                            dmc.Code(
-                                """RobotsConfig(
-    block_ai_training=True,
-    allow_ai_search=True,
-    allow_traditional=True,
-    crawl_delay=10,
-    disallowed_paths=["/admin", "/api/*"]
-)""",
-                                block=True,
-                            ),
-                        ], p="lg", radius="md", withBorder=True),
-                    ], gap="lg"),
-                ]),
+                _CONFIG_PANEL,
             ]
         ),
 
         # Footer Navigation
-        dmc.Divider(mt="xl", mb="lg"),
-        dmc.Group([
-            dcc.Link("← Home", href="/", style={"textDecoration": "none"}),
-            dcc.Link("Equipment", href="/equipment", style={"textDecoration": "none"}),
-            dcc.Link("Analytics", href="/analytics", style={"textDecoration": "none"}),
-        ], gap="lg"),
+        *_FOOTER_NAV,
 
     ], size="xl", py="xl")
 
@@ -371,8 +374,8 @@ def create_stat_card(value, label, icon, color="violet"):
     ], p="lg", radius="md", withBorder=True, shadow="sm")
 
 
-def create_chart_card(title, description, chart):
-    """Create a chart card with consistent styling."""
+def create_chart_card(title, description, graph_id):
+    """Create a chart card with consistent styling; the figure is set by refresh_dashboard()."""
     return dmc.Paper([
         dmc.Stack([
             dmc.Stack([
@@ -380,7 +383,7 @@ def create_chart_card(title, description, chart):
                 dmc.Text(description, size="sm", c="dimmed"),
             ], gap=4),
             dcc.Graph(
-                figure=chart,
+                id=graph_id,
                 config={'displayModeBar': False},
                 style={"height": "350px"}
             ),
@@ -399,17 +402,39 @@ def create_bot_type_info(title, bots, status, color):
     ], p="md", radius="md", withBorder=True)
 
 
-def create_device_pie_chart(stats):
-    """Create pie chart for device distribution."""
+def _memoized_figure(build):
+    """Memoize a figure builder on its hashable arguments.
+
+    The builder returns the figure as JSON, which is what gets cached; every call
+    decodes it into a fresh dict, so a caller editing its figure can't change what
+    later dashboards are served.
+    """
+    cached = lru_cache(maxsize=64)(build)
+
+    @wraps(build)
+    def figure(*args):
+        return json.loads(cached(*args))
+
+    figure.cache_info = cached.cache_info
+    figure.cache_clear = cached.cache_clear
+    return figure
+
+
+# Chart builders take hashable counts and are memoized, so a refresh with unchanged
+# data reuses the serialized figure instead of rebuilding it through Plotly
+@_memoized_figure
+def create_device_pie_chart(device_counts):
+    """Create pie chart for device distribution from (desktop, mobile, tablet, bot) counts."""
+    desktop, mobile, tablet, bot = device_counts
     labels = []
     values = []
     colors = ['#7950f2', '#495057', '#495057', '#495057', '#495057']  # Violet primary, gray for others
 
     device_data = [
-        ('Desktop', stats['desktop']),
-        ('Mobile', stats['mobile']),
-        ('Tablet', stats['tablet']),
-        ('Bots', stats['bot']),
+        ('Desktop', desktop),
+        ('Mobile', mobile),
+        ('Tablet', tablet),
+        ('Bots', bot),
     ]
 
     for label, value in device_data:
@@ -445,11 +470,12 @@ def create_device_pie_chart(stats):
         font=dict(size=12),
     )
 
-    return fig
+    return fig.to_json()
 
 
+@_memoized_figure
 def create_bot_types_chart(bot_types):
-    """Create bar chart for bot types."""
+    """Create bar chart for bot types from (bot type, count) pairs."""
     if not bot_types:
         fig = go.Figure()
         fig.add_annotation(
@@ -467,7 +493,7 @@ def create_bot_types_chart(bot_types):
             margin=dict(t=10, b=10, l=10, r=10),
             height=350,
         )
-        return fig
+        return fig.to_json()
 
     # Map bot types to colors - using restrained palette
     color_map = {
@@ -477,8 +503,8 @@ def create_bot_types_chart(bot_types):
         'unknown': '#868e96'
     }
 
-    labels = list(bot_types.keys())
-    values = list(bot_types.values())
+    labels = [label for label, _ in bot_types]
+    values = [value for _, value in bot_types]
     colors = [color_map.get(label, '#868e96') for label in labels]
 
     # Capitalize labels for display
@@ -501,11 +527,12 @@ def create_bot_types_chart(bot_types):
         font=dict(size=12),
     )
 
-    return fig
+    return fig.to_json()
 
 
+@_memoized_figure
 def create_hourly_chart(hourly_data):
-    """Create stacked area chart for hourly visits."""
+    """Create stacked area chart from (hour, desktop, mobile, tablet, bot) rows."""
     if not hourly_data:
         fig = go.Figure()
         fig.add_annotation(
@@ -523,13 +550,9 @@ def create_hourly_chart(hourly_data):
             margin=dict(t=10, b=10, l=10, r=10),
             height=350,
         )
-        return fig
+        return fig.to_json()
 
-    hours = list(hourly_data.keys())
-    desktop_counts = [hourly_data[h]['desktop'] for h in hours]
-    mobile_counts = [hourly_data[h]['mobile'] for h in hours]
-    tablet_counts = [hourly_data[h]['tablet'] for h in hours]
-    bot_counts = [hourly_data[h]['bot'] for h in hours]
+    hours, desktop_counts, mobile_counts, tablet_counts, bot_counts = map(list, zip(*hourly_data))
 
     fig = go.Figure()
 
@@ -586,9 +609,10 @@ def create_hourly_chart(hourly_data):
         font=dict(size=12),
     )
 
-    return fig
+    return fig.to_json()
 
 
+@_memoized_figure
 def create_top_pages_chart(top_pages):
     """Create horizontal bar chart for top pages."""
     if not top_pages:
@@ -608,7 +632,7 @@ def create_top_pages_chart(top_pages):
             margin=dict(t=10, b=10, l=10, r=10),
             height=350,
         )
-        return fig
+        return fig.to_json()
 
     pages = [page[0] for page in top_pages]
     counts = [page[1] for page in top_pages]
@@ -631,7 +655,11 @@ def create_top_pages_chart(top_pages):
         font=dict(size=12),
     )
 
-    return fig
+    return fig.to_json()
+
+
+def _truncate(text, length):
+    return text[:length] + "..." if len(text) > length else text
 
 
 def create_bot_visits_table(bot_visits):
@@ -639,47 +667,148 @@ def create_bot_visits_table(bot_visits):
     if not bot_visits:
         return dmc.Text("No bot visits recorded yet.", c="dimmed", fs="italic")
 
-    rows = []
-    for visit in bot_visits:
-        timestamp = visit.get('timestamp', 'Unknown')
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            time_str = timestamp
-
-        bot_type = visit.get('bot_type', 'unknown')
-
-        # Color code by bot type
-        if bot_type == 'training':
-            badge = dmc.Badge("Training", color="red", size="sm", variant="filled")
-        elif bot_type == 'search':
-            badge = dmc.Badge("Search", color="blue", size="sm", variant="filled")
-        elif bot_type == 'traditional':
-            badge = dmc.Badge("Traditional", color="green", size="sm", variant="filled")
-        else:
-            badge = dmc.Badge("Unknown", color="gray", size="sm", variant="outline")
-
-        user_agent = visit.get('user_agent', 'Unknown')
-        truncated_ua = user_agent[:80] + "..." if len(user_agent) > 80 else user_agent
-
-        rows.append(
-            dmc.TableTr([
-                dmc.TableTd(dmc.Text(time_str, size="sm", ff="monospace")),
-                dmc.TableTd(badge),
-                dmc.TableTd(dmc.Code(visit.get('path', '/'), style={"fontSize": "12px"})),
-                dmc.TableTd(dmc.Text(truncated_ua, size="xs", c="dimmed", style={"maxWidth": "400px"})),
-            ])
-        )
+    rows = [
+        dmc.TableTr([
+            dmc.TableTd(dmc.Text(visit.get('timestamp') or 'Unknown', size="sm", ff="monospace")),
+            # Color code by bot type
+            dmc.TableTd(_BADGES.get(visit.get('bot_type'), _BADGE_UNKNOWN)),
+            dmc.TableTd(dmc.Code(visit.get('path', '/'), style={"fontSize": "12px"})),
+            dmc.TableTd(dmc.Text(_truncate(visit.get('user_agent', 'Unknown'), 80), size="xs", c="dimmed", style={"maxWidth": "400px"})),
+        ])
+        for visit in bot_visits
+    ]
 
     return dmc.Table([
-        dmc.TableThead(
-            dmc.TableTr([
-                dmc.TableTh("Timestamp"),
-                dmc.TableTh("Bot Type"),
-                dmc.TableTh("Page"),
-                dmc.TableTh("User Agent"),
-            ])
-        ),
+        _BOT_TABLE_HEAD,
         dmc.TableTbody(rows),
-    ], striped=True, highlightOnHover=True, withTableBorder=True, withColumnBorders=True)
\ No newline at end of file
+    ], striped=True, highlightOnHover=True, withTableBorder=True, withColumnBorders=True)
+
+
+# ============================================================================
+# STATIC SECTIONS
+# ============================================================================
+
+# Everything below is the same on every render, so it is built once at import and
+# layout() only creates the stat cards, charts and bot table
+
+# Header Section - Improved visual hierarchy
+_HEADER = dmc.Stack([
+    dmc.Group([
+        dmc.Stack([
+            dmc.Title("Admin Dashboard", order=1, c="gray.9"),
+            dmc.Text(
+                "Visitor Analytics & Bot Tracking",
+                size="lg",
+                c="dimmed"
+            ),
+        ], gap=4),
+        dmc.Stack([
+            dmc.Badge("Hidden Page", color="red", size="lg", variant="filled"),
+            dmc.Text("Not in sitemap.xml", size="xs", c="dimmed"),
+        ], gap=4, align="flex-end"),
+    ], justify="space-between", align="flex-start"),
+
+    # Info Alert - Better clarity
+    dmc.Alert(
+        children=[
+            dmc.Text([
+                "This page demonstrates ",
+                dmc.Code("mark_hidden()"),
+                " functionality. It's excluded from sitemaps, blocked in robots.txt, and returns 404 for AI bot documentation requests."
+            ], size="sm"),
+        ],
+        title="🔒 Privacy Control Demo",
+        color="blue",
+        variant="light",
+        radius="md",
+    ),
+], gap="xl", mb="xl")
+
+_TABS_LIST = dmc.TabsList([
+    dmc.TabsTab("Overview", value="overview"),
+    dmc.TabsTab("Bot Activity", value="bots"),
+    dmc.TabsTab("Configuration", value="config"),
+])
+
+_BOT_MONITORING_ALERT = dmc.Alert(
+    children="Track AI training bots, AI search bots, and traditional search engines visiting your application.",
+    title="Bot Monitoring",
+    color="blue",
+    variant="light",
+)
+
+# Configuration Tab
+_CONFIG_PANEL = dmc.TabsPanel(value="config", pt="xl", children=[
+    dmc.Stack([
+        # Bot Type Reference
+        dmc.Paper([
+            dmc.Title("Bot Type Reference", order=3, mb="lg"),
+            dmc.SimpleGrid(
+                cols={"base": 1, "sm": 3},
+                spacing="lg",
+                children=[
+                    create_bot_type_info(
+                        "AI Training",
+                        "GPTBot, anthropic-ai, Claude-Web, CCBot, Google-Extended",
+                        "🚫 Blocked by default",
+                        "red"
+                    ),
+                    create_bot_type_info(
+                        "AI Search",
+                        "ChatGPT-User, ClaudeBot, PerplexityBot",
+                        "✅ Allowed by default",
+                        "blue"
+                    ),
+                    create_bot_type_info(
+                        "Traditional",
+                        "Googlebot, Bingbot, Yahoo, DuckDuckBot",
+                        "✅ Allowed by default",
+                        "green"
+                    ),
+                ]
+            ),
+        ], p="lg", radius="md", withBorder=True, mb="lg"),
+
+        # Current Configuration
+        dmc.Paper([
+            dmc.Title("Current Configuration", order=3, mb="md"),
+            dmc.Code(
+                """RobotsConfig(
+    block_ai_training=True,
+    allow_ai_search=True,
+    allow_traditional=True,
+    crawl_delay=10,
+    disallowed_paths=["/admin", "/api/*"]
+)""",
+                block=True,
+            ),
+        ], p="lg", radius="md", withBorder=True),
+    ], gap="lg"),
+])
+
+# Footer Navigation
+_FOOTER_NAV = [
+    dmc.Divider(mt="xl", mb="lg"),
+    dmc.Group([
+        dcc.Link("← Home", href="/", style={"textDecoration": "none"}),
+        dcc.Link("Equipment", href="/equipment", style={"textDecoration": "none"}),
+        dcc.Link("Analytics", href="/analytics", style={"textDecoration": "none"}),
+    ], gap="lg"),
+]
+
+# Bot visits table: badges are shared by every row of the same bot type
+_BADGES = {
+    "training": dmc.Badge("Training", color="red", size="sm", variant="filled"),
+    "search": dmc.Badge("Search", color="blue", size="sm", variant="filled"),
+    "traditional": dmc.Badge("Traditional", color="green", size="sm", variant="filled"),
+}
+_BADGE_UNKNOWN = dmc.Badge("Unknown", color="gray", size="sm", variant="outline")
+
+_BOT_TABLE_HEAD = dmc.TableThead(
+    dmc.TableTr([
+        dmc.TableTh("Timestamp"),
+        dmc.TableTh("Bot Type"),
+        dmc.TableTh("Page"),
+        dmc.TableTh("User Agent"),
+    ])
+)
@@ -1,116 +1,168 @@
+from functools import lru_cache
+
 import dash_mantine_components as dmc
-from dash import Input, Output, callback, dcc, html, register_page
-from dash_improve_my_llms import mark_important, register_page_metadata
+from dash import Input, Output, Patch, State, callback, dcc, html, no_update
+from dash_improve_my_llms import mark_important, register_page_with_meta
 
-register_page(
+register_page_with_meta(
     __name__,
     path="/equipment",
     name="Equipment Catalog",
+    description="Browse and filter the complete equipment catalog with search and category filters",
 )
 
-register_page_metadata(
-    path="/equipment",
-    name="Equipment Catalog",
-    description="Browse and filter the complete equipment catalog with search and category filters",
+# Mock data (the catalog does not change at runtime, so counts are computed once)
+EQUIPMENT = (
+    {"name": "Drill Press", "category": "tools", "status": "Available"},
+    {"name": "Forklift", "category": "vehicles", "status": "In Use"},
+    {"name": "CNC Machine", "category": "machinery", "status": "Maintenance"},
+    {"name": "Hand Tools Set", "category": "tools", "status": "Available"},
 )
+TOTAL_COUNT = len(EQUIPMENT)
+AVAILABLE_COUNT = sum(1 for e in EQUIPMENT if e["status"] == "Available")
 
+# Lookup structures for the filter callback: lowercased names, and the indices of
+# the items in each category ("all" covers the whole catalog)
+_NAMES_LOWER = tuple(e["name"].lower() for e in EQUIPMENT)
+_BY_CATEGORY = {
+    category: tuple(i for i, e in enumerate(EQUIPMENT) if e["category"] == category)
+    for category in dict.fromkeys(e["category"] for e in EQUIPMENT)
+}
+_BY_CATEGORY["all"] = tuple(range(TOTAL_COUNT))
 
-def layout():
-    return html.Div(
+# Styles shared by every rendered row
+_ROW_STYLE = {"marginBottom": "10px"}
+_UNAVAILABLE_STYLE = {"color": "orange"}
+_STATUS_STYLES = {
+    "Available": {"color": "green"},
+    "In Use": _UNAVAILABLE_STYLE,
+    "Maintenance": _UNAVAILABLE_STYLE,
+}
+
+# One row per catalog item, built once; callbacks only choose which rows to show
+_ROWS = tuple(
+    html.Div(
         [
-            html.H1("Equipment Catalog"),
-            mark_important(
-                html.Div(
-                    [
-                        html.H2("Filters"),
-                        dmc.TextInput(
-                            id="equipment-search",
-                            placeholder="Search equipment...",
-                            style={"marginBottom": "10px", "width": "300px"},
-                        ),
-                        dmc.Select(
-                            id="equipment-category",
-                            data=[
-                                {"value": "all", "label": "All Categories"},
-                                {"value": "tools", "label": "Tools"},
-                                {"value": "machinery", "label": "Machinery"},
-                                {"value": "vehicles", "label": "Vehicles"},
-                            ],
-                            value="all",
-                            placeholder="Select category",
-                            style={"marginBottom": "20px", "width": "300px"},
-                        ),
-                    ],
-                    id="filters",
-                )
-            ),
-            html.Div(
-                [
-                    html.H2("Equipment List"),
-                    html.Div(id="equipment-list"),
-                ]
-            ),
-            html.Div(
-                [
-                    html.H3("Statistics"),
-                    html.P(id="equipment-stats", children="Loading statistics..."),
-                ],
-                style={"marginTop": "20px", "padding": "15px", "background": "#f5f5f5"},
-            ),
+            html.Strong(e["name"]),
+            f" - {e['category'].title()} - ",
+            html.Span(e["status"], style=_STATUS_STYLES.get(e["status"], _UNAVAILABLE_STYLE)),
+        ],
+        style=_ROW_STYLE,
+    )
+    for e in EQUIPMENT
+)
+
+
+def _stats(showing):
+    return f"Total Items: {TOTAL_COUNT} | Showing: {showing} | Available: {AVAILABLE_COUNT}"
+
+
+# The page has no per-request state, so the tree is built once at import
+_LAYOUT = html.Div(
+    [
+        html.H1("Equipment Catalog"),
+        mark_important(
             html.Div(
                 [
-                    dcc.Link("← Back to Home", href="/"),
-                    " | ",
-                    dcc.Link("View Analytics →", href="/analytics"),
+                    html.H2("Filters"),
+                    dmc.TextInput(
+                        id="equipment-search",
+                        placeholder="Search equipment...",
+                        debounce=300,
+                        style={"marginBottom": "10px", "width": "300px"},
+                    ),
+                    dmc.Select(
+                        id="equipment-category",
+                        data=[
+                            {"value": "all", "label": "All Categories"},
+                            {"value": "tools", "label": "Tools"},
+                            {"value": "machinery", "label": "Machinery"},
+                            {"value": "vehicles", "label": "Vehicles"},
+                        ],
+                        value="all",
+                        placeholder="Select category",
+                        style={"marginBottom": "20px", "width": "300px"},
+                    ),
                 ],
-                style={"marginTop": "20px"},
-            ),
-        ]
-    )
+                id="filters",
+            )
+        ),
+        html.Div(
+            [
+                html.H2("Equipment List"),
+                # Pre-rendered with the unfiltered catalog so no callback runs on load
+                html.Div(id="equipment-list", children=list(_ROWS)),
+                dcc.Store(id="equipment-prev", data=list(range(TOTAL_COUNT))),
+            ]
+        ),
+        html.Div(
+            [
+                html.H3("Statistics"),
+                html.P(id="equipment-stats", children=_stats(TOTAL_COUNT)),
+            ],
+            style={"marginTop": "20px", "padding": "15px", "background": "#f5f5f5"},
+        ),
+        html.Div(
+            [
+                dcc.Link("← Back to Home", href="/"),
+                " | ",
+                dcc.Link("View Analytics →", href="/analytics"),
+            ],
+            style={"marginTop": "20px"},
+        ),
+    ]
+)
+
+
+def layout():
+    return _LAYOUT
 
 
 @callback(
     Output("equipment-list", "children"),
     Output("equipment-stats", "children"),
+    Output("equipment-prev", "data"),
     Input("equipment-search", "value"),
     Input("equipment-category", "value"),
+    State("equipment-prev", "data"),
+    prevent_initial_call=True,
 )
-def update_equipment_list(search, category):
-    # Mock data
-    equipment = [
-        {"name": "Drill Press", "category": "tools", "status": "Available"},
-        {"name": "Forklift", "category": "vehicles", "status": "In Use"},
-        {"name": "CNC Machine", "category": "machinery", "status": "Maintenance"},
-        {"name": "Hand Tools Set", "category": "tools", "status": "Available"},
-    ]
+def update_equipment_list(search, category, prev):
+    # The cached tuple is shared between calls; the store and the Patch get a list
+    indices = list(_filter_equipment((search or "").lower(), category or "all"))
 
-    # Filter
-    filtered = equipment
-    if category and category != "all":
-        filtered = [e for e in filtered if e["category"] == category]
-    if search:
-        filtered = [e for e in filtered if search.lower() in e["name"].lower()]
+    if prev == indices:
+        return no_update, no_update, no_update
 
-    # Build list
-    list_items = [
-        html.Div(
-            [
-                html.Strong(e["name"]),
-                f" - {e['category'].title()} - ",
-                html.Span(
-                    e["status"],
-                    style={"color": "green" if e["status"] == "Available" else "orange"},
-                ),
-            ],
-            style={"marginBottom": "10px"},
-        )
-        for e in filtered
-    ]
+    # Only the "Showing" count varies, so the sentence is resent only when it changes
+    stats = _stats(len(indices)) if len(indices) != len(prev) else no_update
+    return _patch_rows(prev, indices), stats, indices
+
+
+def _patch_rows(prev, indices):
+    """Turn the rows shown for ``prev`` into those for ``indices`` with a Patch.
+
+    Both index lists are in catalog order, so dropped rows are deleted from the
+    back and new rows are inserted front to back at their final positions; the
+    rows present in both are never re-sent.
+    """
+    patched = Patch()
+    keep = set(indices)
+    for pos in range(len(prev) - 1, -1, -1):
+        if prev[pos] not in keep:
+            del patched[pos]
+    shown = set(prev)
+    for pos, i in enumerate(indices):
+        if i not in shown:
+            patched.insert(pos, _ROWS[i])
+    return patched
 
-    available_count = sum(1 for e in equipment if e["status"] == "Available")
-    stats = (
-        f"Total Items: {len(equipment)} | Showing: {len(filtered)} | "
-        f"Available: {available_count}"
-    )
 
-    return list_items, stats
+# Output depends only on the normalized query and category, so repeated
+# keystroke sequences (typing, then backspacing) are served from the cache
+@lru_cache(maxsize=256)
+def _filter_equipment(query, category):
+    indices = _BY_CATEGORY.get(category, ())
+    if query:
+        return tuple(i for i in indices if query in _NAMES_LOWER[i])
+    return indices
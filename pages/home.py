@@ -1,545 +1,334 @@
-import dash_mantine_components as dmc
-from dash import dcc, html, register_page
-from dash_improve_my_llms import mark_important, register_page_metadata
+from pathlib import Path
 
-register_page(
+from dash import dcc, html
+from dash_improve_my_llms import is_hidden, mark_important, register_page_with_meta
+
+# Register the page along with its metadata for better llms.txt generation
+register_page_with_meta(
     __name__,
     path="/",
     name="Home",
+    description="Welcome page for the Equipment Management System with navigation and overview",
 )
 
-# Register metadata for better llms.txt generation
-register_page_metadata(
-    path="/",
-    name="Home",
-    description="Welcome page for the Equipment Management System with navigation and overview",
+# ASCII diagram showing how the dash-improve-my-llms hook works, kept in a text
+# file next to this module so the source stays readable
+ARCHITECTURE_DIAGRAM = Path(__file__).with_name("architecture_diagram.txt").read_text(
+    encoding="utf-8"
 )
 
-# ASCII Diagram showing how dash-improve-my-llms hook works
-ARCHITECTURE_DIAGRAM = """
-╔════════════════════════════════════════════════════════════════════════════════╗
-║                    DASH-IMPROVE-MY-LLMS HOOK ARCHITECTURE                      ║
-╚════════════════════════════════════════════════════════════════════════════════╝
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  STEP 1: INTEGRATE WITH YOUR DASH APP                                          │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    Your Dash Application                     Hook Integration
-    ─────────────────────                     ────────────────
-
-    from dash import Dash                     from dash_improve_my_llms import (
-    from dash import dcc, html    ──────►         add_llms_routes,
-                                                   RobotsConfig,
-    app = Dash(__name__)          ──────►         mark_hidden
-                                              )
-
-    # Your pages here                        # Add the hook (1 line!)
-    @app.callback(...)            ──────►    add_llms_routes(app)
-    def my_callback(...):
-        ...                                   # Optional: Configure bot management
-                                              app._robots_config = RobotsConfig(
-    app.run(debug=True)                           block_ai_training=True,
-                                                  allow_ai_search=True
-                                              )
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  STEP 2: AUTOMATIC ROUTE GENERATION                                            │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    Hook automatically creates these routes for EVERY page in your app:
-
-    Your Page: /                    Auto-Generated Routes:
-    ───────────                     ──────────────────────
-         │
-         ├──────────────────────────► /llms.txt            (LLM-friendly markdown)
-         │
-         ├──────────────────────────► /page.json           (Technical architecture)
-         │
-         └──────────────────────────► /architecture.txt    (App overview - global)
-
-    Your Page: /equipment           Auto-Generated Routes:
-    ─────────────────               ──────────────────────
-         │
-         ├──────────────────────────► /equipment/llms.txt
-         │
-         └──────────────────────────► /equipment/page.json
-
-    Your Page: /analytics           Auto-Generated Routes:
-    ─────────────────               ──────────────────────
-         │
-         ├──────────────────────────► /analytics/llms.txt
-         │
-         └──────────────────────────► /analytics/page.json
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  STEP 3: SEO & BOT MANAGEMENT (v0.2.0)                                         │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    Global Routes (Auto-Generated):
-    ───────────────────────────────
-
-    /robots.txt       ───►  🤖 Bot Access Control
-                            ├─ Block AI Training Bots (GPTBot, CCBot)
-                            ├─ Allow AI Search Bots (ChatGPT-User, ClaudeBot)
-                            ├─ Allow Traditional Bots (Googlebot, Bingbot)
-                            └─ Custom crawl delays & disallowed paths
-
-    /sitemap.xml      ───►  🗺️  SEO Sitemap
-                            ├─ Lists all public pages
-                            ├─ Smart priority inference (homepage=1.0, dashboards=0.9)
-                            ├─ Change frequency detection
-                            └─ Excludes hidden pages (mark_hidden)
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  STEP 4: CONTENT EXTRACTION & GENERATION                                       │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    Your Dash Layout                         What Gets Extracted:
-    ───────────────                          ───────────────────
-
-    html.Div([                               📊 Component Tree
-        html.H1("Dashboard"),      ────►         ├─ All component types
-        dcc.Dropdown(id='filter'),               ├─ Component IDs & properties
-        dcc.Graph(id='chart'),                   └─ Nesting structure
-
-        mark_important(            ────►     ⭐ Important Sections
-            html.Div([                           └─ Highlighted for LLMs
-                html.H2("Key Metrics")
-            ])                                🔗 Navigation Links
-        ),                         ────►         ├─ Internal links (dcc.Link)
-                                                 └─ External links (html.A)
-        dcc.Link("Analytics",
-            href="/analytics")                🎯 Callbacks & Interactivity
-    ])                             ────►         ├─ Input components
-                                                 ├─ Output components
-    @callback(                                   ├─ State tracking
-        Output('chart', 'figure'),               └─ Data flow graph
-        Input('filter', 'value')
-    )                              ────►     📝 Page Metadata
-    def update_chart(filter_val):                ├─ Page name & description
-        ...                                      ├─ Component counts
-                                                 └─ Purpose inference
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  STEP 5: GENERATED OUTPUT FILES                                                │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    ┌─────────────────────────────────────────────────────────────────────────┐
-    │  /llms.txt  (Markdown - LLM-Optimized Context)                          │
-    ├─────────────────────────────────────────────────────────────────────────┤
-    │  # Equipment Catalog                                                    │
-    │                                                                          │
-    │  > Browse and filter equipment with search and category filters         │
-    │                                                                          │
-    │  ## Application Context                                                 │
-    │  This page is part of a multi-page Dash application with 3 pages.      │
-    │                                                                          │
-    │  ## Interactive Elements                                                │
-    │  - TextInput (ID: equipment-search) - Search equipment...               │
-    │  - Select (ID: equipment-category) - Select category                    │
-    │                                                                          │
-    │  ## Data Flow & Callbacks                                               │
-    │  Callback 1: Updates equipment-list.children                            │
-    │    Triggered by: equipment-search.value, equipment-category.value       │
-    └─────────────────────────────────────────────────────────────────────────┘
-
-    ┌─────────────────────────────────────────────────────────────────────────┐
-    │  /page.json  (JSON - Technical Architecture)                            │
-    ├─────────────────────────────────────────────────────────────────────────┤
-    │  {                                                                       │
-    │    "path": "/equipment",                                                │
-    │    "name": "Equipment Catalog",                                         │
-    │    "components": {                                                       │
-    │      "ids": {                                                            │
-    │        "equipment-search": {"type": "TextInput", ...},                  │
-    │        "equipment-category": {"type": "Select", ...}                    │
-    │      },                                                                  │
-    │      "categories": {                                                     │
-    │        "inputs": ["equipment-search", "equipment-category"],            │
-    │        "interactive": [...]                                             │
-    │      }                                                                   │
-    │    },                                                                    │
-    │    "interactivity": {                                                    │
-    │      "has_callbacks": true,                                             │
-    │      "callback_count": 1                                                │
-    │    }                                                                     │
-    │  }                                                                       │
-    └─────────────────────────────────────────────────────────────────────────┘
-
-    ┌─────────────────────────────────────────────────────────────────────────┐
-    │  /architecture.txt  (ASCII Art - App Overview)                          │
-    ├─────────────────────────────────────────────────────────────────────────┤
-    │  ┌─ ENVIRONMENT                                                         │
-    │  ├─── Python Version: 3.12.3                                            │
-    │  ├─── Dash Version: 3.3.0                                               │
-    │  ├─── Key Dependencies: dash-mantine-components, plotly, pandas         │
-    │  │                                                                       │
-    │  ├─ CALLBACKS                                                           │
-    │  ├─── Total Callbacks: 4                                                │
-    │  ├─── By Module:                                                        │
-    │  │    ├─── pages.equipment: 1 callback(s)                               │
-    │  │    └─── pages.analytics: 1 callback(s)                               │
-    │  │                                                                       │
-    │  ├─ PAGES                                                               │
-    │  │  ├── Home (Path: /)                                                  │
-    │  │  │   ├─ Components: 35                                               │
-    │  │  │   └─ Interactive: 0                                               │
-    │  │  │                                                                    │
-    │  │  ├── Equipment Catalog (Path: /equipment)                            │
-    │  │  │   ├─ Components: 23                                               │
-    │  │  │   ├─ Interactive: 2                                               │
-    │  │  │   └─ Callbacks: 1                                                 │
-    │  │  │                                                                    │
-    │  │  └── Analytics Dashboard (Path: /analytics)                          │
-    │  │      ├─ Components: 41                                               │
-    │  │      └─ Interactive: 1                                               │
-    │  └─ END                                                                  │
-    └─────────────────────────────────────────────────────────────────────────┘
-
-┌─────────────────────────────────────────────────────────────────────────────────┐
-│  PRIVACY & BOT CONTROL (v0.2.0)                                                │
-└─────────────────────────────────────────────────────────────────────────────────┘
-
-    Hide Sensitive Pages:                    Result:
-    ────────────────────                     ───────
-
-    mark_hidden("/admin")          ────►     ❌ Excluded from sitemap.xml
-                                             ❌ Blocked in robots.txt
-                                             ❌ /admin/llms.txt returns 404
-                                             ❌ /admin/page.json returns 404
-                                             ✅ Still accessible to logged-in users
-
-    Bot Management:                          Result:
-    ──────────────                           ───────
-
-    RobotsConfig(                  ────►     🚫 GPTBot, CCBot blocked (training)
-      block_ai_training=True,                ✅ ChatGPT-User allowed (search)
-      allow_ai_search=True,                  ✅ Googlebot allowed (traditional)
-      crawl_delay=10                         ⏱️  10s delay between requests
-    )
 
-╔════════════════════════════════════════════════════════════════════════════════╗
-║  BENEFITS FOR LLMS & DEVELOPERS                                                ║
-╚════════════════════════════════════════════════════════════════════════════════╝
+# The two large code blocks, shared by every render of the page
+_ARCH_STYLE = {
+    "background": "#1e1e1e",
+    "color": "#d4d4d4",
+    "padding": "20px",
+    "borderRadius": "8px",
+    "overflow": "auto",
+    "fontSize": "12px",
+    "fontFamily": "monospace",
+    "lineHeight": "1.5",
+    "border": "2px solid #667eea",
+    "boxShadow": "0 4px 6px rgba(0,0,0,0.1)"
+}
+_ARCH_PRE = html.Pre(ARCHITECTURE_DIAGRAM, style=_ARCH_STYLE)
+
+QUICKSTART_CODE = """from dash import Dash
+from dash_improve_my_llms import add_llms_routes
 
-    LLM Benefits:                            Developer Benefits:
-    ─────────────                            ──────────────────
+app = Dash(__name__, use_pages=True)
+add_llms_routes(app)  # ✨ That's it!
 
-    ✅ Complete app context                  ✅ Auto-generated docs (always in sync)
-    ✅ Page purpose understanding            ✅ Zero maintenance overhead
-    ✅ Interactive elements mapped           ✅ One-line integration
-    ✅ Data flow comprehension               ✅ Comprehensive testing (88 tests)
-    ✅ Navigation structure                  ✅ Bot management & SEO built-in
-    ✅ Callback relationships                ✅ Privacy controls for sensitive pages
+app.run(debug=True)"""
+_QUICKSTART_STYLE = {
+    "background": "#f8f9fa",
+    "padding": "15px",
+    "borderRadius": "5px",
+    "border": "1px solid #e0e0e0",
+    "fontFamily": "monospace",
+    "fontSize": "14px"
+}
+_QUICKSTART_PRE = html.Pre(QUICKSTART_CODE, style=_QUICKSTART_STYLE)
+
+# ASCII Architecture Diagram
+_ARCH_SECTION = html.Div(
+    [
+        html.H2("🏗️ Hook Architecture & Integration Flow"),
+        _ARCH_PRE,
+    ],
+    style={"marginBottom": "40px"}
+)
 
-═══════════════════════════════════════════════════════════════════════════════════
 
-Made with ❤️  by Pip Install Python LLC | https://pip-install-python.com
-"""
+# Quick Start Section
+_QUICKSTART_SECTION = html.Div(
+    [
+        html.H2("🚀 Quick Start"),
+        html.P("Get started with just 3 lines of code:"),
+        _QUICKSTART_PRE,
+    ],
+    style={"marginBottom": "30px"}
+)
 
 
-# Define layout - must be named 'layout'
-def layout():
-    return html.Div(
-        [
-            html.H1("Welcome to dash-improve-my-llms v0.2.0"),
-            html.P(
-                "Make your Dash applications AI-friendly with automatic documentation generation, "
-                "bot management, and SEO optimization.",
-                style={"fontSize": "18px", "marginBottom": "30px"}
-            ),
+# Styles repeated across the sections below
+_FLEX_ROW = {"display": "flex"}
+_COLUMN_STYLE = {"flex": "1", "marginRight": "15px"}
+_COLUMN_STYLE_LAST = {"flex": "1"}
+_H3_STYLE = {"fontSize": "18px"}
+_FEATURE_LIST_STYLE = {"fontSize": "14px"}
+_LINK_STYLE = {"fontWeight": "bold"}
+_CARD_STYLE_LAST = {
+    "flex": "1",
+    "background": "white",
+    "padding": "20px",
+    "borderRadius": "8px",
+    "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"
+}
+_CARD_STYLE = {**_CARD_STYLE_LAST, "marginRight": "15px"}
+
+
+# Generated routes listed in the quick links section, as (url, description)
+_DOC_LINKS = (
+    ("/llms.txt", "LLM-friendly markdown context (current page)"),
+    ("/page.json", "Technical architecture JSON (current page)"),
+    ("/architecture.txt", "ASCII art app overview (global)"),
+)
+_SEO_LINKS = (
+    ("/robots.txt", "Bot access control & policies"),
+    ("/sitemap.xml", "SEO sitemap with smart priorities"),
+)
+_PAGE_LINKS = (
+    ("/equipment/llms.txt", "Equipment page context"),
+    ("/equipment/page.json", "Equipment page architecture"),
+    ("/analytics/llms.txt", "Analytics page context"),
+    ("/analytics/page.json", "Analytics page architecture"),
+)
 
-            # ASCII Architecture Diagram
-            html.Div(
-                [
-                    html.H2("🏗️ Hook Architecture & Integration Flow"),
-                    html.Pre(
-                        ARCHITECTURE_DIAGRAM,
-                        style={
-                            "background": "#1e1e1e",
-                            "color": "#d4d4d4",
-                            "padding": "20px",
-                            "borderRadius": "8px",
-                            "overflow": "auto",
-                            "fontSize": "12px",
-                            "fontFamily": "monospace",
-                            "lineHeight": "1.5",
-                            "border": "2px solid #667eea",
-                            "boxShadow": "0 4px 6px rgba(0,0,0,0.1)"
-                        }
-                    ),
-                ],
-                style={"marginBottom": "40px"}
-            ),
 
-            # Quick Start Section
-            html.Div(
-                [
-                    html.H2("🚀 Quick Start"),
-                    html.P("Get started with just 3 lines of code:"),
-                    html.Pre(
-                        """from dash import Dash
-from dash_improve_my_llms import add_llms_routes
-
-app = Dash(__name__, use_pages=True)
-add_llms_routes(app)  # ✨ That's it!
+def _a(children, href=None, **kwargs):
+    """External link opening in a new tab; ``href`` defaults to the link text."""
+    return html.A(children, href=href or children, target="_blank", **kwargs)
 
-app.run(debug=True)""",
-                        style={
-                            "background": "#f8f9fa",
-                            "padding": "15px",
-                            "borderRadius": "5px",
-                            "border": "1px solid #e0e0e0",
-                            "fontFamily": "monospace",
-                            "fontSize": "14px"
-                        }
-                    ),
-                ],
-                style={"marginBottom": "30px"}
-            ),
 
-            # Quick Links Section
-            mark_important(
-                html.Div(
-                    [
-                        html.H2("🔗 Try the Generated Documentation"),
-                        html.P("See the hook in action - explore the auto-generated routes:"),
-                        html.Div(
-                            [
-                                # Documentation Routes
-                                html.Div(
-                                    [
-                                        html.H3("📄 Documentation Routes (v0.1.0)", style={"fontSize": "18px"}),
-                                        html.Ul(
-                                            [
-                                                html.Li([
-                                                    html.A("/llms.txt", href="/llms.txt", target="_blank"),
-                                                    " - LLM-friendly markdown context (current page)"
-                                                ]),
-                                                html.Li([
-                                                    html.A("/page.json", href="/page.json", target="_blank"),
-                                                    " - Technical architecture JSON (current page)"
-                                                ]),
-                                                html.Li([
-                                                    html.A("/architecture.txt", href="/architecture.txt", target="_blank"),
-                                                    " - ASCII art app overview (global)"
-                                                ]),
-                                            ]
-                                        ),
-                                    ],
-                                    style={"flex": "1", "marginRight": "20px"}
-                                ),
-
-                                # SEO Routes
-                                html.Div(
-                                    [
-                                        html.H3("🤖 SEO Routes (v0.2.0 NEW!)", style={"fontSize": "18px", "color": "#51cf66"}),
-                                        html.Ul(
-                                            [
-                                                html.Li([
-                                                    html.A("/robots.txt", href="/robots.txt", target="_blank"),
-                                                    " - Bot access control & policies"
-                                                ]),
-                                                html.Li([
-                                                    html.A("/sitemap.xml", href="/sitemap.xml", target="_blank"),
-                                                    " - SEO sitemap with smart priorities"
-                                                ]),
-                                            ]
-                                        ),
-                                    ],
-                                    style={"flex": "1"}
-                                ),
-                            ],
-                            style={"display": "flex"}
-                        ),
+def _link_li(url, desc):
+    return html.Li([_a(url), f" - {desc}"])
 
-                        # Page-Specific Routes
-                        html.Div(
-                            [
-                                html.H3("📑 Page-Specific Routes", style={"fontSize": "18px", "marginTop": "20px"}),
-                                html.P("Every page gets its own documentation:"),
-                                html.Ul(
-                                    [
-                                        html.Li([
-                                            html.A("/equipment/llms.txt", href="/equipment/llms.txt", target="_blank"),
-                                            " - Equipment page context"
-                                        ]),
-                                        html.Li([
-                                            html.A("/equipment/page.json", href="/equipment/page.json", target="_blank"),
-                                            " - Equipment page architecture"
-                                        ]),
-                                        html.Li([
-                                            html.A("/analytics/llms.txt", href="/analytics/llms.txt", target="_blank"),
-                                            " - Analytics page context"
-                                        ]),
-                                        html.Li([
-                                            html.A("/analytics/page.json", href="/analytics/page.json", target="_blank"),
-                                            " - Analytics page architecture"
-                                        ]),
-                                    ]
-                                ),
-                            ]
-                        ),
-                    ],
-                    id="quick-links",
-                    style={
-                        "background": "linear-gradient(135deg, #667eea15 0%, #764ba215 100%)",
-                        "padding": "25px",
-                        "borderRadius": "10px",
-                        "border": "2px solid #667eea"
-                    }
-                )
-            ),
 
-            # Navigation to Other Pages
+# Quick links to the generated routes; mark_important registers "quick-links"
+# once, at import
+_QUICK_LINKS_SECTION = mark_important(
+    html.Div(
+        [
+            html.H2("🔗 Try the Generated Documentation"),
+            html.P("See the hook in action - explore the auto-generated routes:"),
             html.Div(
                 [
-                    html.H2("📱 Explore Example Pages"),
+                    # Documentation Routes
                     html.Div(
                         [
-                            html.Div(
-                                [
-                                    html.H3("🔧 Equipment", style={"fontSize": "18px"}),
-                                    html.P("Browse and filter equipment catalog with interactive filters"),
-                                    dcc.Link("View Equipment →", href="/equipment", style={"fontWeight": "bold"})
-                                ],
-                                style={
-                                    "flex": "1",
-                                    "background": "white",
-                                    "padding": "20px",
-                                    "borderRadius": "8px",
-                                    "boxShadow": "0 2px 4px rgba(0,0,0,0.1)",
-                                    "marginRight": "15px"
-                                }
-                            ),
-                            html.Div(
-                                [
-                                    html.H3("📊 Analytics", style={"fontSize": "18px"}),
-                                    html.P("Real-time analytics dashboard with Plotly visualizations"),
-                                    dcc.Link("View Analytics →", href="/analytics", style={"fontWeight": "bold"})
-                                ],
-                                style={
-                                    "flex": "1",
-                                    "background": "white",
-                                    "padding": "20px",
-                                    "borderRadius": "8px",
-                                    "boxShadow": "0 2px 4px rgba(0,0,0,0.1)",
-                                    "marginRight": "15px"
-                                }
-                            ),
-                            html.Div(
-                                [
-                                    html.H3("🔒 Admin", style={"fontSize": "18px", "color": "#ff6b6b"}),
-                                    html.P("Hidden admin dashboard with visitor analytics (mark_hidden demo)"),
-                                    dcc.Link("View Admin →", href="/admin", style={"fontWeight": "bold", "color": "#ff6b6b"})
-                                ],
-                                style={
-                                    "flex": "1",
-                                    "background": "white",
-                                    "padding": "20px",
-                                    "borderRadius": "8px",
-                                    "boxShadow": "0 2px 4px rgba(0,0,0,0.1)"
-                                }
-                            ),
+                            html.H3("📄 Documentation Routes (v0.1.0)", style=_H3_STYLE),
+                            html.Ul([_link_li(url, desc) for url, desc in _DOC_LINKS]),
                         ],
-                        style={"display": "flex"}
+                        style={"flex": "1", "marginRight": "20px"}
                     ),
-                ],
-                style={"marginTop": "40px"}
-            ),
 
-            # Features Section
-            html.Div(
-                [
-                    html.H2("✨ v0.2.0 Features"),
+                    # SEO Routes
                     html.Div(
                         [
-                            html.Div(
-                                [
-                                    html.H3("🤖 Bot Management", style={"fontSize": "16px", "color": "#667eea"}),
-                                    html.Ul(
-                                        [
-                                            html.Li("Block AI training bots (GPTBot, CCBot)"),
-                                            html.Li("Allow AI search bots (ChatGPT-User, ClaudeBot)"),
-                                            html.Li("Control traditional search engines"),
-                                            html.Li("Custom crawl delays & rules"),
-                                        ],
-                                        style={"fontSize": "14px"}
-                                    ),
-                                ],
-                                style={"flex": "1", "marginRight": "15px"}
-                            ),
-                            html.Div(
-                                [
-                                    html.H3("🗺️ SEO Optimization", style={"fontSize": "16px", "color": "#51cf66"}),
-                                    html.Ul(
-                                        [
-                                            html.Li("Automatic sitemap.xml generation"),
-                                            html.Li("Smart priority inference"),
-                                            html.Li("Change frequency detection"),
-                                            html.Li("robots.txt with policies"),
-                                        ],
-                                        style={"fontSize": "14px"}
-                                    ),
-                                ],
-                                style={"flex": "1", "marginRight": "15px"}
-                            ),
-                            html.Div(
-                                [
-                                    html.H3("🔐 Privacy Controls", style={"fontSize": "16px", "color": "#ff6b6b"}),
-                                    html.Ul(
-                                        [
-                                            html.Li("mark_hidden() for pages"),
-                                            html.Li("mark_component_hidden()"),
-                                            html.Li("Exclude from sitemaps"),
-                                            html.Li("404 for bot requests"),
-                                        ],
-                                        style={"fontSize": "14px"}
-                                    ),
-                                ],
-                                style={"flex": "1"}
-                            ),
+                            html.H3("🤖 SEO Routes (v0.2.0 NEW!)", style={"fontSize": "18px", "color": "#51cf66"}),
+                            html.Ul([_link_li(url, desc) for url, desc in _SEO_LINKS]),
                         ],
-                        style={"display": "flex"}
+                        style=_COLUMN_STYLE_LAST
                     ),
                 ],
-                style={
-                    "marginTop": "40px",
-                    "background": "#f8f9fa",
-                    "padding": "20px",
-                    "borderRadius": "8px"
-                }
+                style=_FLEX_ROW
             ),
 
-            # Test Report
+            # Page-Specific Routes
             html.Div(
                 [
-                    html.H2("🧪 Quality Assurance"),
-                    html.P([
-                        "✅ ",
-                        html.Strong("88/88 Tests Passing (100%)"),
-                        " - Comprehensive test coverage with 98-100% for new modules"
-                    ]),
-                    html.P([
-                        "📊 View the complete ",
-                        html.A(
-                            "Test Report",
-                            href="https://github.com/yourusername/dash-improve-my-llms/blob/main/TEST_REPORT.md",
-                            target="_blank",
-                            style={"color": "#51cf66"}
-                        ),
-                        " for detailed test results and coverage analysis."
-                    ]),
+                    html.H3("📑 Page-Specific Routes", style={"fontSize": "18px", "marginTop": "20px"}),
+                    html.P("Every page gets its own documentation:"),
+                    html.Ul([_link_li(url, desc) for url, desc in _PAGE_LINKS]),
+                ]
+            ),
+        ],
+        id="quick-links",
+        style={
+            "background": "linear-gradient(135deg, #667eea15 0%, #764ba215 100%)",
+            "padding": "25px",
+            "borderRadius": "10px",
+            "border": "2px solid #667eea"
+        }
+    )
+)
+
+
+# Cards linking to the example pages
+_NAV_CARDS = (
+    [
+        html.H3("🔧 Equipment", style=_H3_STYLE),
+        html.P("Browse and filter equipment catalog with interactive filters"),
+        dcc.Link("View Equipment →", href="/equipment", style=_LINK_STYLE)
+    ],
+    [
+        html.H3("📊 Analytics", style=_H3_STYLE),
+        html.P("Real-time analytics dashboard with Plotly visualizations"),
+        dcc.Link("View Analytics →", href="/analytics", style=_LINK_STYLE)
+    ],
+)
+_ADMIN_CARD = [
+    html.H3("🔒 Admin", style={"fontSize": "18px", "color": "#ff6b6b"}),
+    html.P("Hidden admin dashboard with visitor analytics (mark_hidden demo)"),
+    dcc.Link("View Admin →", href="/admin", style={"fontWeight": "bold", "color": "#ff6b6b"})
+]
+
+
+def _nav_section(cards):
+    return html.Div(
+        [
+            html.H2("📱 Explore Example Pages"),
+            html.Div(
+                [
+                    html.Div(card, style=_CARD_STYLE if n < len(cards) else _CARD_STYLE_LAST)
+                    for n, card in enumerate(cards, 1)
                 ],
-                style={
-                    "marginTop": "30px",
-                    "background": "#e3f2fd",
-                    "padding": "20px",
-                    "borderRadius": "8px",
-                    "border": "1px solid #2196f3"
-                }
+                style=_FLEX_ROW
             ),
         ],
-        style={"maxWidth": "1200px"}
+        style={"marginTop": "40px"}
     )
+
+
+_NAV_SECTION = _nav_section(_NAV_CARDS + (_ADMIN_CARD,))
+
+
+# Features Section
+_FEATURES_SECTION = html.Div(
+    [
+        html.H2("✨ v0.2.0 Features"),
+        html.Div(
+            [
+                html.Div(
+                    [
+                        html.H3("🤖 Bot Management", style={"fontSize": "16px", "color": "#667eea"}),
+                        html.Ul(
+                            [
+                                html.Li("Block AI training bots (GPTBot, CCBot)"),
+                                html.Li("Allow AI search bots (ChatGPT-User, ClaudeBot)"),
+                                html.Li("Control traditional search engines"),
+                                html.Li("Custom crawl delays & rules"),
+                            ],
+                            style=_FEATURE_LIST_STYLE
+                        ),
+                    ],
+                    style=_COLUMN_STYLE
+                ),
+                html.Div(
+                    [
+                        html.H3("🗺️ SEO Optimization", style={"fontSize": "16px", "color": "#51cf66"}),
+                        html.Ul(
+                            [
+                                html.Li("Automatic sitemap.xml generation"),
+                                html.Li("Smart priority inference"),
+                                html.Li("Change frequency detection"),
+                                html.Li("robots.txt with policies"),
+                            ],
+                            style=_FEATURE_LIST_STYLE
+                        ),
+                    ],
+                    style=_COLUMN_STYLE
+                ),
+                html.Div(
+                    [
+                        html.H3("🔐 Privacy Controls", style={"fontSize": "16px", "color": "#ff6b6b"}),
+                        html.Ul(
+                            [
+                                html.Li("mark_hidden() for pages"),
+                                html.Li("mark_component_hidden()"),
+                                html.Li("Exclude from sitemaps"),
+                                html.Li("404 for bot requests"),
+                            ],
+                            style=_FEATURE_LIST_STYLE
+                        ),
+                    ],
+                    style=_COLUMN_STYLE_LAST
+                ),
+            ],
+            style=_FLEX_ROW
+        ),
+    ],
+    style={
+        "marginTop": "40px",
+        "background": "#f8f9fa",
+        "padding": "20px",
+        "borderRadius": "8px"
+    }
+)
+
+
+# Test Report
+_TEST_REPORT_SECTION = html.Div(
+    [
+        html.H2("🧪 Quality Assurance"),
+        html.P([
+            "✅ ",
+            html.Strong("88/88 Tests Passing (100%)"),
+            " - Comprehensive test coverage with 98-100% for new modules"
+        ]),
+        html.P([
+            "📊 View the complete ",
+            _a(
+                "Test Report",
+                href="https://github.com/yourusername/dash-improve-my-llms/blob/main/TEST_REPORT.md",
+                style={"color": "#51cf66"}
+            ),
+            " for detailed test results and coverage analysis."
+        ]),
+    ],
+    style={
+        "marginTop": "30px",
+        "background": "#e3f2fd",
+        "padding": "20px",
+        "borderRadius": "8px",
+        "border": "1px solid #2196f3"
+    }
+)
+
+
+# The page has no per-request state, so the tree is built once at import
+_LAYOUT = html.Div(
+    [
+        html.H1("Welcome to dash-improve-my-llms v0.2.0"),
+        html.P(
+            "Make your Dash applications AI-friendly with automatic documentation generation, "
+            "bot management, and SEO optimization.",
+            style={"fontSize": "18px", "marginBottom": "30px"}
+        ),
+        _ARCH_SECTION,
+        _QUICKSTART_SECTION,
+        _QUICK_LINKS_SECTION,
+        _NAV_SECTION,
+        _FEATURES_SECTION,
+        _TEST_REPORT_SECTION,
+    ],
+    style={"maxWidth": "1200px"}
+)
+
+# Same page without the admin card, used once /admin is marked hidden so the
+# home page's llms.txt doesn't point bots at it (the top navigation bar still
+# links there). Pages are imported in no fixed order, so this is decided per
+# render rather than at import.
+_PUBLIC_LAYOUT = html.Div(
+    [
+        _nav_section(_NAV_CARDS) if child is _NAV_SECTION else child
+        for child in _LAYOUT.children
+    ],
+    style=_LAYOUT.style
+)
+
+
+# Define layout - must be named 'layout'
+def layout():
+    return _PUBLIC_LAYOUT if is_hidden("/admin") else _LAYOUT
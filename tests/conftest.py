@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+import dash_improve_my_llms
+
+
+@pytest.fixture(autouse=True)
+def reset_registries():
+    """Start every test with empty module-level registries."""
+    registries = (
+        dash_improve_my_llms._important_components,
+        dash_improve_my_llms._page_metadata,
+        dash_improve_my_llms._hidden_pages,
+        dash_improve_my_llms._hidden_components,
+    )
+    for registry in registries:
+        registry.clear()
+    yield
+    for registry in registries:
+        registry.clear()
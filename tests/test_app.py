@@ -0,0 +1,80 @@
+"""
+Tests for the example app's analytics storage.
+"""
+
+import atexit
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import dash
+import pytest
+
+
+@pytest.fixture(scope="module")
+def example_app(tmp_path_factory):
+    """Import app.py with its analytics files in a temporary directory.
+
+    The writer threads are stopped and the global page registry is restored
+    afterwards.
+    """
+    registry = dict(dash.page_registry)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANALYTICS_DIR", str(tmp_path_factory.mktemp("analytics")))
+        mp.syspath_prepend(str(Path(__file__).parent.parent))
+        module = importlib.import_module("app")
+        try:
+            yield module
+        finally:
+            atexit.unregister(module._shutdown_analytics)
+            module._shutdown_analytics()
+            module._conn.close()
+            sys.modules.pop("app", None)
+            dash.page_registry.clear()
+            dash.page_registry.update(registry)
+
+
+def test_migration_skips_visits_without_usable_timestamp(example_app, tmp_path, monkeypatch):
+    """Test legacy visits with a missing or malformed timestamp are dropped."""
+    legacy = tmp_path / "visitor_analytics.json"
+    legacy.write_text(
+        json.dumps(
+            {
+                "visits": [
+                    {"path": "/", "timestamp": "2024-01-02T03:04:05"},
+                    {"path": "/missing"},
+                    {"path": "/malformed", "timestamp": "yesterday"},
+                    {"path": "/epoch", "timestamp": 1700000000},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    saved = []
+    monkeypatch.setattr(example_app, "ANALYTICS_FILE", legacy)
+    monkeypatch.setattr(example_app, "save_analytics", saved.extend)
+
+    example_app._migrate_analytics_once()
+
+    assert [row[1] for row in saved] == ["/", "/epoch"]
+    assert all(isinstance(row[0], float) for row in saved)
+    assert not legacy.exists()
+    assert legacy.with_suffix(".json.migrated").exists()
+
+
+def test_sitemap_rerendered_when_a_page_moves_or_metadata_changes(example_app, monkeypatch):
+    """Test the pre-rendered sitemap follows page paths and page metadata."""
+    from dash_improve_my_llms import register_page_metadata
+
+    before = example_app._sitemap_bytes()
+    monkeypatch.setitem(dash.page_registry["pages.equipment"], "path", "/gear")
+
+    moved = example_app._sitemap_bytes()
+    assert moved != before
+    assert b"/gear</loc>" in moved
+
+    key = example_app._sitemap["key"]
+    register_page_metadata("/gear", name="Gear", description="Renamed")
+    example_app._sitemap_bytes()
+    assert example_app._sitemap["key"] != key
@@ -27,6 +27,7 @@ from dash_improve_my_llms.bot_detection import (
     is_any_bot,
     get_bot_type,
     get_all_bot_lists,
+    classify_bots,
 )
 
 
@@ -142,4 +143,18 @@ def test_empty_user_agent():
     """Test handling of empty user agent."""
     ua = ""
     assert is_any_bot(ua) is False
-    assert get_bot_type(ua) == "unknown"
\ No newline at end of file
+    assert get_bot_type(ua) == "unknown"
+
+
+def test_classify_bots():
+    """Test batch classification keeps input order and handles repeats."""
+    uas = [
+        "Mozilla/5.0 (compatible; GPTBot/1.0)",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0",
+        "Mozilla/5.0 (compatible; GPTBot/1.0)",
+        "Mozilla/5.0 (compatible; Googlebot/2.1)",
+        "ClaudeBot/1.0",
+    ]
+    assert classify_bots(uas) == [get_bot_type(ua) for ua in uas]
+    assert classify_bots(iter(uas[:2])) == ["training", "unknown"]
+    assert classify_bots([]) == []
@@ -5,6 +5,7 @@ Tests for HTML generation module.
 import pytest
 from dash_improve_my_llms.html_generator import (
     generate_static_page_html,
+    index_important_sections,
     generate_index_template,
 )
 
@@ -361,4 +362,45 @@ def test_generate_static_page_html_escapes_html():
     )
 
     # Should include the content (not escaped in marked_important as it's trusted HTML)
-    assert "<p>Test & Content</p>" in html
\ No newline at end of file
+    assert "<p>Test & Content</p>" in html
+
+    # Page metadata is not trusted HTML and should be escaped
+    assert "<title>Test &amp; Page</title>" in html
+    assert 'content="Test &lt; Description"' in html
+
+
+def test_generate_index_template_structured_data_is_valid_json():
+    """Test that app names with quotes or </script> keep the JSON-LD valid."""
+    import json
+    import re
+
+    template = generate_index_template(
+        app_config={"name": 'My "Quoted" </script> App', "description": "Test"},
+        pages=[],
+    )
+
+    blocks = re.findall(r'<script type="application/ld\+json">(.*?)</script>', template, re.S)
+    assert len(blocks) == 2
+    assert json.loads(blocks[0])["name"] == 'My "Quoted" </script> App'
+
+
+def test_generate_static_page_html_accepts_indexed_sections():
+    """Test that pre-grouped sections render the same as the flat list."""
+    marked_important = [
+        {"page_path": "/a", "id": "a1", "html_content": "<p>A1</p>"},
+        {"page_path": "/b", "id": "b1", "html_content": "<p>B1</p>"},
+        {"page_path": "/a", "id": "a2", "html_content": "<p>A2</p>"},
+    ]
+    index = index_important_sections(marked_important)
+    assert [m["id"] for m in index["/a"]] == ["a1", "a2"]
+
+    for path in ("/a", "/b", "/missing"):
+        kwargs = dict(
+            page_path=path,
+            page_metadata={"name": "Page"},
+            all_pages=[],
+            app_config={"name": "Test App"},
+        )
+        assert generate_static_page_html(
+            marked_important=index, **kwargs
+        ) == generate_static_page_html(marked_important=marked_important, **kwargs)
@@ -4,6 +4,8 @@ Integration tests for dash-improve-my-llms.
 Tests the complete flow of all modules working together.
 """
 
+import re
+
 import pytest
 from dash import Dash, html, dcc
 from dash_improve_my_llms import (
@@ -19,6 +21,8 @@ from dash_improve_my_llms.robots_generator import RobotsConfig, generate_robots_
 from dash_improve_my_llms.sitemap_generator import generate_sitemap_xml
 from dash_improve_my_llms.html_generator import generate_static_page_html
 
+_LOC_RE = re.compile(r"<loc>([^<]+)</loc>")
+
 
 def test_mark_hidden_integration():
     """Test mark_hidden functionality integration."""
@@ -225,6 +229,24 @@ def test_page_metadata_registration():
     assert _page_metadata["/test"]["author"] == "Test Author"
 
 
+def test_register_page_with_meta():
+    """Test page and metadata registration in a single call."""
+    import dash
+    from dash_improve_my_llms import _page_metadata, register_page_with_meta
+
+    Dash(__name__, use_pages=True, pages_folder="")
+    try:
+        register_page_with_meta("meta_page", path="/meta", description="Registered together")
+
+        assert dash.page_registry["meta_page"]["path"] == "/meta"
+        assert dash.page_registry["meta_page"]["description"] == "Registered together"
+        assert _page_metadata["/meta"]["name"] == dash.page_registry["meta_page"]["name"]
+        assert _page_metadata["/meta"]["description"] == "Registered together"
+    finally:
+        # dash.page_registry is global and not reset between tests
+        dash.page_registry.pop("meta_page", None)
+
+
 def test_mark_important_with_extraction():
     """Test mark_important integration with text extraction."""
     from dash_improve_my_llms import extract_text_content
@@ -300,20 +322,15 @@ def test_sitemap_priority_ordering():
 
     sitemap = generate_sitemap_xml(pages=pages, base_url="https://example.com")
 
-    # Split into URLs to check order
-    url_pattern = "<loc>https://example.com"
-    urls_in_order = []
-    for line in sitemap.split("\n"):
-        if url_pattern in line:
-            urls_in_order.append(line.strip())
+    urls_in_order = _LOC_RE.findall(sitemap)
 
     # Check that homepage appears first (highest priority)
-    assert "<loc>https://example.com/</loc>" in urls_in_order[0]
+    assert urls_in_order[0] == "https://example.com/"
 
     # Check that dashboard appears before about/docs
-    dashboard_idx = next(i for i, url in enumerate(urls_in_order) if "/dashboard" in url)
-    about_idx = next(i for i, url in enumerate(urls_in_order) if "/about" in url)
-    docs_idx = next(i for i, url in enumerate(urls_in_order) if "/docs" in url)
+    dashboard_idx = urls_in_order.index("https://example.com/dashboard")
+    about_idx = urls_in_order.index("https://example.com/about")
+    docs_idx = urls_in_order.index("https://example.com/docs")
 
     assert dashboard_idx < about_idx
     assert dashboard_idx < docs_idx
@@ -445,6 +462,21 @@ def test_end_to_end_scenario():
     print(f"✅ Generated static HTML ({len(static_html)} bytes)")
 
 
+def test_json_response_matches_jsonify():
+    """Test page.json serialization gives the same document as jsonify."""
+    import json
+
+    from flask import Flask, jsonify
+    from dash_improve_my_llms import _json_response
+
+    data = {"path": "/", "components": {"ids": {"b": 2, "a": 1}}, "name": "Ünïcode"}
+
+    with Flask(__name__).app_context():
+        response = _json_response(data)
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == json.loads(jsonify(data).get_data())
+
+
 if __name__ == "__main__":
     # Run the end-to-end test
-    test_end_to_end_scenario()
\ No newline at end of file
+    test_end_to_end_scenario()
@@ -2,12 +2,33 @@
 Tests for robots.txt generator module.
 """
 
+import re
+
 import pytest
 from dash_improve_my_llms.robots_generator import (
     RobotsConfig,
     generate_robots_txt,
 )
 
+# User agents whose block is immediately followed by a site-wide Disallow
+_DISALLOWED_AGENT_RE = re.compile(r"^User-agent: (\S+)\nDisallow: /$", re.MULTILINE)
+
+
+@pytest.fixture(scope="module")
+def default_robots_txt():
+    """robots.txt for a default RobotsConfig, shared by the read-only tests."""
+    return generate_robots_txt(
+        config=RobotsConfig(),
+        sitemap_url="https://example.com/sitemap.xml",
+        base_url="https://example.com",
+    )
+
+
+@pytest.fixture(scope="module")
+def default_robots_lines(default_robots_txt):
+    """Set of lines in the default robots.txt, for whole-line membership checks."""
+    return set(default_robots_txt.splitlines())
+
 
 def test_robots_config_defaults():
     """Test default RobotsConfig values."""
@@ -40,28 +61,18 @@ def test_robots_config_custom():
     assert len(config.disallowed_paths) == 2
 
 
-def test_generate_robots_txt_default():
+def test_generate_robots_txt_default(default_robots_txt, default_robots_lines):
     """Test robots.txt generation with default config."""
-    config = RobotsConfig()
-    robots_content = generate_robots_txt(
-        config=config,
-        sitemap_url="https://example.com/sitemap.xml",
-        base_url="https://example.com",
-    )
+    robots_lines = default_robots_lines
 
     # Check basic structure
-    assert "User-agent: *" in robots_content
-    assert "Allow: /" in robots_content
-    assert "Sitemap: https://example.com/sitemap.xml" in robots_content
+    assert "User-agent: *" in robots_lines
+    assert "Allow: /" in robots_lines
+    assert "Sitemap: https://example.com/sitemap.xml" in robots_lines
 
-    # Check AI training bots are blocked by default
-    assert "User-agent: GPTBot" in robots_content
-    assert "User-agent: anthropic-ai" in robots_content
-    assert "User-agent: CCBot" in robots_content
-    assert "User-agent: Google-Extended" in robots_content
-
-    # Check each blocked bot has Disallow
-    assert robots_content.count("User-agent: GPTBot\nDisallow: /") > 0
+    # Check AI training bots are blocked by default, each with a Disallow
+    blocked = set(_DISALLOWED_AGENT_RE.findall(default_robots_txt))
+    assert {"GPTBot", "anthropic-ai", "CCBot", "Google-Extended"} <= blocked
 
 
 def test_generate_robots_txt_allow_all():
@@ -130,14 +141,9 @@ def test_generate_robots_txt_with_custom_rules():
     assert "Disallow: /no-mybot" in robots_content
 
 
-def test_robots_txt_has_ai_search_bots():
+def test_robots_txt_has_ai_search_bots(default_robots_txt):
     """Test that AI search bots are explicitly allowed."""
-    config = RobotsConfig(allow_ai_search=True)
-    robots_content = generate_robots_txt(
-        config=config,
-        sitemap_url="https://example.com/sitemap.xml",
-        base_url="https://example.com",
-    )
+    robots_content = default_robots_txt
 
     # Check AI search bots are mentioned
     assert "User-agent: ChatGPT-User" in robots_content or "AI Search" in robots_content
@@ -145,14 +151,9 @@ def test_robots_txt_has_ai_search_bots():
     assert "User-agent: PerplexityBot" in robots_content or "AI Search" in robots_content
 
 
-def test_robots_txt_has_documentation_links():
+def test_robots_txt_has_documentation_links(default_robots_txt):
     """Test that robots.txt includes AI-friendly documentation links."""
-    config = RobotsConfig()
-    robots_content = generate_robots_txt(
-        config=config,
-        sitemap_url="https://example.com/sitemap.xml",
-        base_url="https://example.com",
-    )
+    robots_content = default_robots_txt
 
     assert "https://example.com/llms.txt" in robots_content
     assert "https://example.com/architecture.txt" in robots_content
@@ -171,17 +172,11 @@ def test_robots_txt_sitemap_reference():
     assert "Sitemap: https://myapp.com/sitemap.xml" in robots_content
 
 
-def test_robots_txt_blocks_specific_training_bots():
+def test_robots_txt_blocks_specific_training_bots(default_robots_txt):
     """Test that specific AI training bots are blocked."""
-    config = RobotsConfig(block_ai_training=True)
-    robots_content = generate_robots_txt(
-        config=config,
-        sitemap_url="https://example.com/sitemap.xml",
-        base_url="https://example.com",
-    )
 
     # Check all major training bots
-    training_bots = [
+    training_bots = {
         "GPTBot",
         "anthropic-ai",
         "Claude-Web",
@@ -189,20 +184,15 @@ def test_robots_txt_blocks_specific_training_bots():
         "Google-Extended",
         "FacebookBot",
         "ByteSpider",
-    ]
+    }
 
-    for bot in training_bots:
-        assert f"User-agent: {bot}" in robots_content
+    blocked = set(_DISALLOWED_AGENT_RE.findall(default_robots_txt))
+    assert training_bots - blocked == set()
 
 
-def test_robots_txt_format():
+def test_robots_txt_format(default_robots_txt):
     """Test that robots.txt has proper format."""
-    config = RobotsConfig()
-    robots_content = generate_robots_txt(
-        config=config,
-        sitemap_url="https://example.com/sitemap.xml",
-        base_url="https://example.com",
-    )
+    robots_content = default_robots_txt
 
     # Check it starts with comment
     assert robots_content.startswith("#")
@@ -237,4 +227,22 @@ def test_robots_txt_combined_config():
     assert "Disallow: /admin" in robots_content
     assert "User-agent: SpecialBot" in robots_content
     assert "User-agent: GPTBot" in robots_content
-    assert "Sitemap: https://example.com/sitemap.xml" in robots_content
\ No newline at end of file
+    assert "Sitemap: https://example.com/sitemap.xml" in robots_content
+
+
+def test_robots_txt_reflects_config_changes():
+    """Test that editing a config after a call is not hidden by caching."""
+    config = RobotsConfig()
+    kwargs = dict(
+        config=config,
+        sitemap_url="https://example.com/sitemap.xml",
+        base_url="https://example.com",
+    )
+    assert "Disallow: /private" not in generate_robots_txt(**kwargs)
+
+    config.disallowed_paths.append("/private")
+    config.block_ai_training = False
+    robots_content = generate_robots_txt(**kwargs)
+
+    assert "Disallow: /private" in robots_content
+    assert "User-agent: GPTBot" not in robots_content
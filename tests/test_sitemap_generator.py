@@ -6,8 +6,11 @@ import pytest
 from dash_improve_my_llms.sitemap_generator import (
     SitemapEntry,
     generate_sitemap_xml,
+    generate_sitemap_xml_gz,
+    iter_sitemap_xml,
     infer_page_priority,
     infer_change_frequency,
+    write_sitemap,
 )
 
 
@@ -26,6 +29,32 @@ def test_sitemap_entry_creation():
     assert entry.priority == 0.8
 
 
+def test_write_sitemap(tmp_path):
+    """Test writing the sitemap to disk."""
+    pages = [{"path": "/", "name": "Home"}, {"path": "/docs", "name": "Docs"}]
+    target = tmp_path / "sitemap.xml"
+
+    written = write_sitemap(target, pages=pages, base_url="https://example.com")
+
+    assert written == target
+    assert target.read_text(encoding="utf-8") == generate_sitemap_xml(
+        pages=pages, base_url="https://example.com"
+    )
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_write_sitemap_failure_keeps_previous_file(tmp_path):
+    """Test a failed write leaves no temp file and the old sitemap intact."""
+    target = tmp_path / "sitemap.xml"
+    target.write_text("old", encoding="utf-8")
+
+    with pytest.raises(AttributeError):
+        write_sitemap(target, pages=[None], base_url="https://example.com")
+
+    assert list(tmp_path.iterdir()) == [target]
+    assert target.read_text(encoding="utf-8") == "old"
+
+
 def test_sitemap_entry_to_xml():
     """Test converting sitemap entry to XML."""
     entry = SitemapEntry(
@@ -285,6 +314,21 @@ def test_generate_sitemap_xml_different_base_urls():
     assert "<loc>http://localhost:8050/</loc>" in sitemap3
 
 
+def test_generate_sitemap_xml_normalizes_slashes():
+    """Test that base URL and path are joined with a single slash."""
+    pages = [
+        {"path": "/", "name": "Home"},
+        {"path": "/dashboard", "name": "Dashboard"},
+        {"path": "reports", "name": "Reports"},
+    ]
+    sitemap = generate_sitemap_xml(pages=pages, base_url="https://example.com/")
+
+    assert "<loc>https://example.com/</loc>" in sitemap
+    assert "<loc>https://example.com/dashboard</loc>" in sitemap
+    assert "<loc>https://example.com/reports</loc>" in sitemap
+    assert "//dashboard" not in sitemap
+
+
 def test_generate_sitemap_xml_no_duplicate_urls():
     """Test that sitemap doesn't have duplicate URLs."""
     pages = [
@@ -296,8 +340,35 @@ def test_generate_sitemap_xml_no_duplicate_urls():
 
     # Count how many times /page appears
     page_count = sitemap.count("<loc>https://example.com/page</loc>")
-    # Should appear twice (both duplicates are included, prioritization handles it)
-    assert page_count == 2  # Both are added, sorted by priority
+    # Duplicate paths are collapsed into a single URL
+    assert page_count == 1
+
+
+def test_generate_sitemap_xml_custom_entry_overrides_lower_priority_page():
+    """Test that a custom entry for a page URL replaces it only if it ranks higher."""
+    pages = [{"path": "/page", "name": "Page"}]  # Priority 0.5
+    higher = SitemapEntry(loc="https://example.com/page", changefreq="daily", priority=0.9)
+    lower = SitemapEntry(loc="https://example.com/page", changefreq="yearly", priority=0.1)
+
+    sitemap = generate_sitemap_xml(
+        pages=pages, base_url="https://example.com", custom_entries=[higher]
+    )
+    assert sitemap.count("<loc>https://example.com/page</loc>") == 1
+    assert "<priority>0.9</priority>" in sitemap
+
+    sitemap = generate_sitemap_xml(
+        pages=pages, base_url="https://example.com", custom_entries=[lower]
+    )
+    assert sitemap.count("<loc>https://example.com/page</loc>") == 1
+    assert "<priority>0.5</priority>" in sitemap
+
+
+def test_sitemap_entry_escapes_loc():
+    """Test that URLs with XML special characters are escaped."""
+    entry = SitemapEntry(loc="https://example.com/search?q=a&sort=<new>")
+    xml = entry.to_xml()
+
+    assert "<loc>https://example.com/search?q=a&amp;sort=&lt;new&gt;</loc>" in xml
 
 
 def test_sitemap_entry_none_values():
@@ -313,4 +384,52 @@ def test_sitemap_entry_none_values():
 
     # None values should not appear in the XML
     assert "<changefreq>" not in xml
-    assert "<priority>" not in xml
\ No newline at end of file
+    assert "<priority>" not in xml
+
+
+def test_iter_sitemap_xml_matches_generate():
+    """Test that the streamed chunks join to the same sitemap."""
+    pages = [
+        {"path": "/", "name": "Home"},
+        {"path": "/dashboard", "name": "Dashboard"},
+        {"path": "/admin", "name": "Admin"},
+    ]
+    kwargs = dict(pages=pages, base_url="https://example.com", hidden_paths=["/admin"])
+
+    chunks = list(iter_sitemap_xml(**kwargs))
+
+    # Header, one chunk per URL, footer
+    assert len(chunks) == 4
+    assert "".join(chunks) == generate_sitemap_xml(**kwargs)
+
+
+def test_generate_sitemap_xml_gz():
+    """Test that the gzip variant decompresses to the plain sitemap."""
+    import gzip
+
+    pages = [{"path": "/", "name": "Home"}, {"path": "/docs", "name": "Docs"}]
+    compressed = generate_sitemap_xml_gz(pages=pages, base_url="https://example.com")
+
+    assert gzip.decompress(compressed).decode("utf-8") == generate_sitemap_xml(
+        pages=pages, base_url="https://example.com"
+    )
+    # No timestamp in the header, so output is reproducible
+    assert compressed == generate_sitemap_xml_gz(pages=pages, base_url="https://example.com")
+
+
+def test_generate_sitemap_xml_cache_tracks_inputs():
+    """Test that repeated calls are cached but still follow changed inputs."""
+    pages = [{"path": "/", "name": "Home"}, {"path": "/docs", "name": "Docs"}]
+
+    first = generate_sitemap_xml(pages=pages, base_url="https://example.com")
+    assert generate_sitemap_xml(pages=pages, base_url="https://example.com") is first
+
+    hidden = generate_sitemap_xml(
+        pages=pages, base_url="https://example.com", hidden_paths=["/docs"]
+    )
+    assert "https://example.com/docs" not in hidden
+
+    pages.append({"path": "/about", "name": "About"})
+    assert "https://example.com/about" in generate_sitemap_xml(
+        pages=pages, base_url="https://example.com"
+    )